@@ -47,14 +47,16 @@ async def search_students(
                 pl.col('student_name').str.to_lowercase().str.contains(query.lower())
             )
         elif search_type == "department":
+            # department is Categorical in loader frames; the str namespace
+            # needs Utf8
             results = df.filter(
-                pl.col('department').str.to_lowercase().str.contains(query.lower())
+                pl.col('department').cast(pl.Utf8).str.to_lowercase().str.contains(query.lower())
             )
         else:  # all
             results = df.filter(
                 (pl.col('student_id').cast(pl.Utf8).str.contains(query)) |
                 (pl.col('student_name').str.to_lowercase().str.contains(query.lower())) |
-                (pl.col('department').str.to_lowercase().str.contains(query.lower()))
+                (pl.col('department').cast(pl.Utf8).str.to_lowercase().str.contains(query.lower()))
             )
         
         # Get unique students
@@ -1,5 +1,9 @@
+import json
+
+import flask
 from dash import Dash
 import dash_bootstrap_components as dbc
+from plotly.utils import PlotlyJSONEncoder
 
 from data.loader import load_data
 from data.processor import add_performance_column, get_filter_options
@@ -17,6 +21,20 @@ app = Dash(
 
 server = app.server  # 🔥 Needed by Gunicorn and Render
 
+# 🔹 Gzip the JSON-heavy layout/callback responses (the layout compresses
+# well because its style/className strings repeat heavily)
+try:
+    from flask_compress import Compress
+
+    server.config['COMPRESS_MIMETYPES'] = [
+        'application/json', 'text/html', 'text/css', 'application/javascript'
+    ]
+    server.config['COMPRESS_LEVEL'] = 6
+    server.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(server)
+except ImportError:
+    print("⚠️  flask-compress not installed - responses served uncompressed")
+
 app.title = "Student Analytics Dashboard"
 
 # 🔹 Load data ONCE at import time (not inside main)
@@ -30,6 +48,28 @@ app.layout = create_layout(filter_options)
 # 🔹 Register callbacks BEFORE run
 register_callbacks(app, df)
 
+# 🔹 The layout never changes after startup, so serialize it to JSON once
+# and serve the cached bytes instead of re-encoding the tree per page load
+_LAYOUT_JSON = json.dumps(app.layout.to_plotly_json(), cls=PlotlyJSONEncoder)
+
+
+def _serve_cached_layout():
+    return flask.Response(_LAYOUT_JSON, mimetype='application/json')
+
+
+app.server.view_functions['/_dash-layout'] = _serve_cached_layout
+
+
+# 🔹 Component bundles are fingerprinted per release, so let browsers keep
+# them for a day instead of revalidating on every dashboard refresh
+@app.server.after_request
+def _cache_component_suites(response):
+    if flask.request.path.startswith('/_dash-component-suites/'):
+        response.headers['Cache-Control'] = (
+            'public, max-age=86400, stale-while-revalidate=3600'
+        )
+    return response
+
 
 # 🔹 Local development runner
 def main():
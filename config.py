@@ -53,6 +53,7 @@ HIGH_PERFORMANCE_PASS_RATE = 85  # Departments above this are exemplary
 
 TOP_DEPARTMENTS_DISPLAY = 10
 TOP_SUBJECTS_DISPLAY = 100
+SUBJECT_OPTIONS_LIMIT = 50  # Max dropdown options rendered per search
 CRITICAL_DEPARTMENTS_DISPLAY = 5
 HIGH_PERFORMERS_DISPLAY = 5
 
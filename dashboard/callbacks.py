@@ -11,15 +11,12 @@ FIXES:
 import math
 
 import dash_bootstrap_components as dbc
-from dash import html, Input, Output, State
+from dash import ctx, dcc, html, no_update, Input, Output, State
 from data.processor import filter_data
 from utils.calculations import (
     calculate_rates,
-    get_yearly_data,
+    compute_all,
     get_department_stats,
-    get_assessment_yearly_summary,
-    get_assessment_department_summary,
-    get_subject_difficulty,
     get_department_leaderboard,
 )
 from utils.visualizations import (
@@ -39,6 +36,7 @@ from config import (
     HIGH_PERFORMANCE_PASS_RATE,
     CRITICAL_DEPARTMENTS_DISPLAY,
     HIGH_PERFORMERS_DISPLAY,
+    SUBJECT_OPTIONS_LIMIT,
 )
 import polars as pl
 
@@ -52,21 +50,29 @@ def register_callbacks(app, df):
         df (pl.DataFrame): Main DataFrame
     """
     
-    # NEW CALLBACK: Update subject dropdown based on department selection
+    # NEW CALLBACK: Update subject dropdown based on department selection.
+    # The dropdown is virtualized: only the first SUBJECT_OPTIONS_LIMIT
+    # matches are rendered and typing narrows them server-side, so the
+    # browser never has to draw thousands of option nodes at once.
     @app.callback(
         Output('subject-filter', 'options'),
         Output('subject-filter', 'value'),
-        Input('department-filter', 'value')
+        Input('department-filter', 'value'),
+        Input('subject-filter', 'search_value'),
+        State('subject-filter', 'value'),
     )
-    def update_subject_dropdown(selected_dept):
+    def update_subject_dropdown(selected_dept, search_value, current_subject):
         """
-        Update subject dropdown options based on selected department.
-        
+        Update subject dropdown options based on selected department and
+        the user's search text.
+
         Args:
             selected_dept (str): Selected department
-            
+            search_value (str): Text typed into the dropdown
+            current_subject (str): Currently selected subject (State)
+
         Returns:
-            tuple: (subject_options, default_value)
+            tuple: (subject_options, subject_value)
         """
         if selected_dept == 'All':
             subjects = sorted([s for s in df['subject'].unique().to_list() if s])
@@ -78,31 +84,69 @@ def register_callbacks(app, df):
                     if s
                 ]
             )
-        
+
+        searching = ctx.triggered_id == 'subject-filter'
+        if searching and search_value:
+            needle = search_value.lower()
+            matches = [s for s in subjects if needle in s.lower()][:SUBJECT_OPTIONS_LIMIT]
+        else:
+            matches = subjects[:SUBJECT_OPTIONS_LIMIT]
+
+        # Keep the active selection renderable even when it falls outside
+        # the current match window.
+        if current_subject not in (None, 'All') and current_subject not in matches:
+            matches = [current_subject] + matches
+
         # Create dropdown options (always include All)
         options = [{'label': 'All Subjects', 'value': 'All'}] + [
-            {'label': subj, 'value': subj} for subj in subjects
+            {'label': subj, 'value': subj} for subj in matches
         ]
-        
-        return options, 'All'
+
+        # Only reset the selection when the department actually changed.
+        return options, (no_update if searching else 'All')
     
     
-    # MAIN CALLBACK: Only triggers on search button click (using State instead of Input)
-    @app.callback(
+    # CLIENTSIDE CALLBACK: Format KPI strings in the browser from the compact
+    # kpi-data store payload — no server round-trip for pure presentation.
+    app.clientside_callback(
+        """
+        function(d) {
+            if (!d) { return window.dash_clientside.no_update; }
+            const pct = (v) => (v === null || v === undefined) ? 'N/A' : v.toFixed(1) + '%';
+            return [
+                d.students.toLocaleString(),
+                d.exams.toLocaleString() + ' exam attempts',
+                pct(d.pass_rate),
+                pct(d.dist_rate),
+                pct(d.fail_rate),
+                pct(d.cia_theory),
+                pct(d.ese_theory),
+                pct(d.cia_practical)
+            ];
+        }
+        """,
         [
             Output('kpi-total', 'children'),
             Output('kpi-total-change', 'children'),
             Output('kpi-pass', 'children'),
-            Output('kpi-pass-trend', 'children'),
             Output('kpi-distinction', 'children'),
-            Output('kpi-distinction-trend', 'children'),
             Output('kpi-fail', 'children'),
-            Output('kpi-fail-trend', 'children'),
             Output('kpi-cia-theory', 'children'),
-            Output('kpi-cia-theory-trend', 'children'),
             Output('kpi-ese-theory', 'children'),
-            Output('kpi-ese-theory-trend', 'children'),
             Output('kpi-cia-practical', 'children'),
+        ],
+        Input('kpi-data', 'data')
+    )
+
+    # MAIN CALLBACK: Only triggers on search button click (using State instead of Input)
+    @app.callback(
+        [
+            Output('kpi-data', 'data'),
+            Output('kpi-pass-trend', 'children'),
+            Output('kpi-distinction-trend', 'children'),
+            Output('kpi-fail-trend', 'children'),
+            Output('kpi-cia-theory-trend', 'children'),
+            Output('kpi-ese-theory-trend', 'children'),
             Output('kpi-cia-practical-trend', 'children'),
             Output('alerts-section', 'children'),
             Output('yoy-trends', 'figure'),
@@ -113,7 +157,6 @@ def register_callbacks(app, df):
             Output('dept-leaderboard-chart', 'figure'),
             Output('detail-table', 'children'),
             Output('recommendations', 'children'),
-            Output('loading-output', 'children'),
         ],
         Input('search-button', 'n_clicks'),  # Only input is the search button
         [
@@ -155,9 +198,6 @@ def register_callbacks(app, df):
                 return None
             return value
 
-        def format_percentage(value):
-            return f"{value:.1f}%" if value is not None else "N/A"
-
         def build_trend(current, baseline, label="overall avg", inverse=False, unit="%"):
             if current is None or baseline is None:
                 return create_trend_indicator(None, None, label, inverse, unit=unit)
@@ -169,13 +209,6 @@ def register_callbacks(app, df):
         # Calculate overall dataset average for comparison
         overall_pass, overall_dist, overall_fail, overall_unique, overall_exams = calculate_rates(df)
         
-        # ===== KPIs =====
-        kpi_total = f"{unique_students:,}"
-        kpi_total_change = f"{total_exams:,} exam attempts"
-        kpi_pass = f"{pass_rate:.1f}%"
-        kpi_distinction = f"{dist_rate:.1f}%"
-        kpi_fail = f"{fail_rate:.1f}%"
-        
         # Trends vs overall average
         kpi_pass_trend = create_trend_indicator(pass_rate, overall_pass, "overall avg", inverse_colors=False)
         kpi_dist_trend = create_trend_indicator(dist_rate, overall_dist, "overall avg", inverse_colors=False)
@@ -196,9 +229,18 @@ def register_callbacks(app, df):
             if ese_theory_avg is not None and cia_theory_avg is not None
             else None
         )
-        kpi_cia_theory = format_percentage(cia_theory_avg)
-        kpi_ese_theory = format_percentage(ese_theory_avg)
-        kpi_cia_practical = format_percentage(cia_practical_avg)
+        # ===== KPIs =====
+        # Compact payload for the clientside formatting callback
+        kpi_data = {
+            'students': unique_students,
+            'exams': total_exams,
+            'pass_rate': pass_rate,
+            'dist_rate': dist_rate,
+            'fail_rate': fail_rate,
+            'cia_theory': cia_theory_avg,
+            'ese_theory': ese_theory_avg,
+            'cia_practical': cia_practical_avg,
+        }
 
         kpi_cia_theory_trend = build_trend(
             cia_theory_avg, cia_theory_overall, "overall avg", inverse=False
@@ -211,16 +253,22 @@ def register_callbacks(app, df):
         )
         
         # ===== CHARTS =====
-        yearly_data = get_yearly_data(filtered)
-        assessment_yearly = get_assessment_yearly_summary(filtered)
-        dept_assessment = get_assessment_department_summary(filtered)
-        
+        # Structural invariant: the summaries are computed exactly once per
+        # filter state, in a single pl.collect_all pass so the group_bys run
+        # in parallel. yearly_data feeds the YoY chart AND (joined with the
+        # assessment summary) the detail table — do not recompute it if this
+        # callback is ever split, share this value instead.
+        summaries = compute_all(filtered)
+        yearly_data = summaries['yearly']
+        assessment_yearly = summaries['assessment_yearly']
+        dept_assessment = summaries['assessment_department']
+
         yoy_fig = create_yoy_trends_chart(yearly_data)
         dept_fig = create_department_comparison_chart(filtered, dept)
         dist_fig = create_distribution_chart(filtered)
         assessment_trend_fig = create_assessment_trend_chart(assessment_yearly)
         # Get full subject difficulty data
-        subject_difficulty_df = get_subject_difficulty(filtered)
+        subject_difficulty_df = summaries['subject_difficulty']
 
         # Select only bottom 10 subjects (most difficult = lowest avg_total_marks)
         if subject_difficulty_df is not None and len(subject_difficulty_df) > 0:
@@ -260,20 +308,15 @@ def register_callbacks(app, df):
         )
         
         return (
-            kpi_total, kpi_total_change,
-            kpi_pass, kpi_pass_trend,
-            kpi_distinction, kpi_dist_trend,
-            kpi_fail, kpi_fail_trend,
-            kpi_cia_theory, kpi_cia_theory_trend,
-            kpi_ese_theory, kpi_ese_theory_trend,
-            kpi_cia_practical, kpi_cia_practical_trend,
+            kpi_data,
+            kpi_pass_trend, kpi_dist_trend, kpi_fail_trend,
+            kpi_cia_theory_trend, kpi_ese_theory_trend, kpi_cia_practical_trend,
             alert_section,
             yoy_fig, dept_fig, dist_fig,
             assessment_trend_fig,
             subject_difficulty_fig,
             dept_leaderboard_fig,
             detail_table, recommendations_div,
-            ""  # loading-output
         )
 
 
@@ -287,25 +330,31 @@ def create_detailed_table(yearly_data):
     Returns:
         dbc.Table: Formatted table component
     """
-    table_data = yearly_data.sort('exam_year', descending=True)
+    # get_yearly_data already sorts ascending by exam_year (and the left join
+    # in update_dashboard preserves that order), so a reverse is enough here.
+    # Fix the column order so positional iter_rows() avoids per-row dicts.
+    table_data = yearly_data.reverse().select([
+        'exam_year', 'unique_students', 'total_exams',
+        'pass_rate', 'dist_rate', 'fail_rate',
+    ])
     table_rows = []
-    
-    for row in table_data.iter_rows(named=True):
-        pass_rate = row.get('pass_rate') or 0
+
+    for exam_year, students, exams, pass_rate, dist_rate, fail_rate in table_data.iter_rows():
+        pass_rate = pass_rate or 0
         pass_bg = '#d1fae5' if pass_rate >= 85 else (
             '#fef3c7' if pass_rate >= 75 else '#fee2e2'
         )
-        
+
         table_rows.append(html.Tr([
-            html.Td(str(int(row['exam_year'])), style={'fontWeight': 'bold'}),
-            html.Td(f"{int(row['unique_students']):,}", style={'textAlign': 'center'}),
-            html.Td(f"{int(row['total_exams']):,}", 
+            html.Td(str(exam_year), style={'fontWeight': 'bold'}),
+            html.Td(f"{students:,}", style={'textAlign': 'center'}),
+            html.Td(f"{exams:,}",
                    style={'textAlign': 'center', 'color': '#6b7280'}),
-            html.Td(f"{pass_rate:.1f}%", 
-                   style={'textAlign': 'center', 'backgroundColor': pass_bg, 
+            html.Td(f"{pass_rate:.1f}%",
+                   style={'textAlign': 'center', 'backgroundColor': pass_bg,
                           'padding': '8px', 'borderRadius': '4px'}),
-            html.Td(f"{(row.get('dist_rate') or 0):.1f}%", style={'textAlign': 'center'}),
-            html.Td(f"{(row.get('fail_rate') or 0):.1f}%", style={'textAlign': 'center'}),
+            html.Td(f"{(dist_rate or 0):.1f}%", style={'textAlign': 'center'}),
+            html.Td(f"{(fail_rate or 0):.1f}%", style={'textAlign': 'center'}),
         ]))
     
     return dbc.Table([
@@ -392,18 +441,41 @@ def create_recommendations(
     
     if len(filtered) > 0:
         dept_stats = get_department_stats(filtered)
-        
-        # Critical departments
-        critical_depts = dept_stats.filter(
-            pl.col('pass_rate') < CRITICAL_PASS_RATE
-        ).head(CRITICAL_DEPARTMENTS_DISPLAY)
-        
+
+        # Band departments once and rank within each band, so the critical
+        # and high-performer lists come out of a single pass instead of two
+        # filter+sort scans over dept_stats.
+        banded = (
+            dept_stats
+            .with_columns(
+                pl.when(pl.col('pass_rate') < CRITICAL_PASS_RATE)
+                .then(pl.lit('critical'))
+                .when(pl.col('pass_rate') >= HIGH_PERFORMANCE_PASS_RATE)
+                .then(pl.lit('high'))
+                .otherwise(pl.lit('mid'))
+                .alias('_band')
+            )
+            .filter(pl.col('_band') != 'mid')
+            .with_columns([
+                pl.col('pass_rate').rank('ordinal').over('_band').alias('_asc_rank'),
+                pl.col('pass_rate').rank('ordinal', descending=True).over('_band').alias('_desc_rank'),
+            ])
+        )
+
+        # Critical departments (dept_stats is already sorted by pass_rate asc)
+        critical_depts = banded.filter(
+            (pl.col('_band') == 'critical')
+            & (pl.col('_asc_rank') <= CRITICAL_DEPARTMENTS_DISPLAY)
+        )
+
         if len(critical_depts) > 0:
             dept_items = []
-            for row in critical_depts.iter_rows(named=True):
+            for dept, pass_pct, students, exams in critical_depts.select(
+                ['department', 'pass_rate', 'students', 'exams']
+            ).iter_rows():
                 dept_items.append(
-                    html.Li(f"{row['department']}: {row['pass_rate']:.1f}% "
-                           f"({int(row['students'])} students, {int(row['exams'])} exams)")
+                    html.Li(f"{dept}: {pass_pct:.1f}% "
+                           f"({int(students)} students, {int(exams)} exams)")
                 )
             
             recommendations.append(html.Div([
@@ -415,16 +487,19 @@ def create_recommendations(
             ], className="mb-3"))
         
         # High performing departments
-        high_performers = dept_stats.filter(
-            pl.col('pass_rate') >= HIGH_PERFORMANCE_PASS_RATE
-        ).sort('pass_rate', descending=True).head(HIGH_PERFORMERS_DISPLAY)
-        
+        high_performers = banded.filter(
+            (pl.col('_band') == 'high')
+            & (pl.col('_desc_rank') <= HIGH_PERFORMERS_DISPLAY)
+        ).sort('pass_rate', descending=True)
+
         if len(high_performers) > 0:
             perf_items = []
-            for row in high_performers.iter_rows(named=True):
+            for dept, pass_pct, students, exams in high_performers.select(
+                ['department', 'pass_rate', 'students', 'exams']
+            ).iter_rows():
                 perf_items.append(
-                    html.Li(f"{row['department']}: {row['pass_rate']:.1f}% "
-                           f"({int(row['students'])} students, {int(row['exams'])} exams)")
+                    html.Li(f"{dept}: {pass_pct:.1f}% "
+                           f"({int(students)} students, {int(exams)} exams)")
                 )
             
             recommendations.append(html.Div([
@@ -465,12 +540,14 @@ def create_recommendations(
             )
             if len(high_gap_depts) > 0:
                 gap_items = []
-                for row in high_gap_depts.iter_rows(named=True):
+                for dept, gap, cia_avg, ese_avg in high_gap_depts.select(
+                    ['department', 'theory_gap', 'cia_theory_avg', 'ese_theory_avg']
+                ).iter_rows():
                     gap_items.append(
                         html.Li(
-                            f"{row['department']}: "
-                            f"{row['theory_gap']:.1f} pts theory gap "
-                            f"(CIA {row['cia_theory_avg']:.1f}%, ESE {row['ese_theory_avg']:.1f}%)"
+                            f"{dept}: "
+                            f"{gap:.1f} pts theory gap "
+                            f"(CIA {cia_avg:.1f}%, ESE {ese_avg:.1f}%)"
                         )
                     )
                 recommendations.append(html.Div([
@@ -488,28 +565,33 @@ def create_recommendations(
         year_span = year_range[1] - year_range[0] + 1
         avg_exams = total_exams / unique_students if unique_students > 0 else 0
         
+        # Single Markdown block instead of four html.P components — less
+        # server-side component construction and a smaller layout payload.
+        insights_lines = [
+            f"Analyzing {year_span} year(s) from {year_range[0]} to {year_range[1]}",
+            f"Unique students: {unique_students:,} | Exam attempts: {total_exams:,}",
+        ]
+        if unique_students > 0:
+            insights_lines.append(f"Average exams per student: {avg_exams:.1f}")
+        insights_lines.append(f"Overall pass rate: {pass_rate:.1f}%")
+
         recommendations.append(html.Div([
             html.H6("📅 Selected Period Insights", className="text-info mb-2"),
-            html.P(f"Analyzing {year_span} year(s) from {year_range[0]} to {year_range[1]}", 
-                  className="mb-1"),
-            html.P(f"Unique students: {unique_students:,} | Exam attempts: {total_exams:,}", 
-                  className="mb-1"),
-            html.P(f"Average exams per student: {avg_exams:.1f}" if unique_students > 0 else "", 
-                  className="mb-1"),
-            html.P(f"Overall pass rate: {pass_rate:.1f}%", className="mb-0")
+            dcc.Markdown("\n\n".join(insights_lines), className="mb-0")
         ], className="mb-3"))
     
     if subject_difficulty is not None and len(subject_difficulty) > 0:
         hardest = subject_difficulty.sort('avg_total_marks').head(3)
         easiest = subject_difficulty.sort('avg_total_marks', descending=True).head(3)
         
-        def format_subject_item(row):
-            avg_marks = f"{row['avg_total_marks']:.1f}" if row['avg_total_marks'] is not None else "N/A"
-            pass_rate = f"{row['pass_rate']:.1f}" if row['pass_rate'] is not None else "N/A"
-            return html.Li(f"{row['subject']}: {avg_marks} avg (Pass {pass_rate}%)")
-        
-        hardest_items = [format_subject_item(row) for row in hardest.iter_rows(named=True)]
-        easiest_items = [format_subject_item(row) for row in easiest.iter_rows(named=True)]
+        def format_subject_item(subject, avg_total_marks, pass_rate):
+            avg_marks = f"{avg_total_marks:.1f}" if avg_total_marks is not None else "N/A"
+            pass_pct = f"{pass_rate:.1f}" if pass_rate is not None else "N/A"
+            return html.Li(f"{subject}: {avg_marks} avg (Pass {pass_pct}%)")
+
+        subject_cols = ['subject', 'avg_total_marks', 'pass_rate']
+        hardest_items = [format_subject_item(*row) for row in hardest.select(subject_cols).iter_rows()]
+        easiest_items = [format_subject_item(*row) for row in easiest.select(subject_cols).iter_rows()]
         recommendations.append(html.Div([
             html.H6("🧠 Subject Difficulty Highlights", className="text-secondary mb-2"),
             html.Div([
@@ -526,13 +608,14 @@ def create_recommendations(
         top_df = dept_leaderboard['top']
         bottom_df = dept_leaderboard['bottom']
         if top_df.height > 0 or bottom_df.height > 0:
+            leaderboard_cols = ['department', 'pass_rate', 'students']
             top_items = [
-                html.Li(f"{row['department']}: {row['pass_rate']:.1f}% (Students {int(row['students'])})")
-                for row in top_df.iter_rows(named=True)
+                html.Li(f"{dept}: {pass_pct:.1f}% (Students {int(students)})")
+                for dept, pass_pct, students in top_df.select(leaderboard_cols).iter_rows()
             ]
             bottom_items = [
-                html.Li(f"{row['department']}: {row['pass_rate']:.1f}% (Students {int(row['students'])})")
-                for row in bottom_df.iter_rows(named=True)
+                html.Li(f"{dept}: {pass_pct:.1f}% (Students {int(students)})")
+                for dept, pass_pct, students in bottom_df.select(leaderboard_cols).iter_rows()
             ]
             recommendations.append(html.Div([
                 html.H6("🏅 Department Performance Snapshot", className="text-secondary mb-2"),
@@ -8,9 +8,89 @@ FIXES:
 2. Added overflow visible to all parent containers
 """
 
+import functools
+from sys import intern
+
 import dash_bootstrap_components as dbc
 from dash import dcc, html
-from config import COLORS
+from config import COLORS, SUBJECT_OPTIONS_LIMIT
+
+# Interned copies of the classNames every card repeats, so prop dicts all
+# hold the same string object and compare by pointer in cache lookups.
+_FW_BOLD = intern("fw-bold")
+_SHADOW_SM = intern("shadow-sm")
+
+
+# Shared style constants. Every call used to allocate identical dict
+# literals; one module-level object per style keeps allocations down and
+# gives Dash stable prop identity when diffing re-renders. The filter
+# z-index layering lives in assets/custom.css (.filter-col-z*, .filter-dd-z*)
+# so it crosses the wire as a class name instead of an inline style dict.
+_FILTER_CARD_STYLE = {
+    'position': 'relative',
+    'zIndex': 100,
+    'overflow': 'visible',
+    'backgroundColor': COLORS['card'],
+    'border': 'none',
+    'borderRadius': '16px',
+}
+
+_KPI_CARD_STYLE_BASE = {
+    'position': 'relative',
+    'zIndex': 1,
+    'overflow': 'visible',
+    'backgroundColor': COLORS['card'],
+    'border': 'none',
+    'borderRadius': '16px',
+}
+_KPI_COL_STYLE = {'position': 'relative', 'zIndex': 1}
+
+_CHART_CARD_STYLE = {
+    'position': 'relative',
+    'zIndex': 1,
+    'backgroundColor': COLORS['card'],
+    'border': 'none',
+    'borderRadius': '16px',
+}
+
+# Trend indicator styles: flat/neutral plus the bold good/bad pair.
+_FLAT_STYLE = {'color': '#6b7280', 'fontSize': '0.875rem'}
+_GOOD_STYLE = {'color': '#10b981', 'fontWeight': 'bold', 'fontSize': '0.875rem'}
+_BAD_STYLE = {'color': '#ef4444', 'fontWeight': 'bold', 'fontSize': '0.875rem'}
+
+# Both N/A guards render the identical Span; share one instance.
+_NA_SPAN = html.Span("→ N/A", style=_FLAT_STYLE)
+
+# Static pieces of the filter card's Search column.
+_NBSP_LABEL = html.Label("\u00A0", className="fw-bold mt-3")
+_SEARCH_BTN_STYLE = {'marginTop': '8px'}
+
+
+@functools.lru_cache(maxsize=16)
+def _label_value_options(items):
+    """Build label==value dropdown options once per distinct tuple of values."""
+    return [{'label': item, 'value': item} for item in items]
+
+
+@functools.lru_cache(maxsize=8)
+def _sem_options(semesters):
+    """Build semester dropdown options once per distinct tuple of values."""
+    return [{'label': ('All Semesters' if s == 'All' else f'Sem {s}'),
+             'value': s} for s in semesters]
+
+
+@functools.lru_cache(maxsize=16)
+def _kpi_card_style(border_color):
+    """Build the bordered KPI card style once per distinct border color."""
+    style = dict(_KPI_CARD_STYLE_BASE)
+    style['borderLeft'] = f'4px solid {border_color}'
+    return style
+
+
+@functools.lru_cache(maxsize=8)
+def _year_marks(years):
+    """Build the RangeSlider marks dict once per distinct tuple of years."""
+    return {int(year): str(int(year)) for year in years}
 
 
 def create_filter_card(filter_options):
@@ -24,87 +104,68 @@ def create_filter_card(filter_options):
     Returns:
         dbc.Card: Filter card component
     """
+    # Slice and scan the year list once instead of per-kwarg ('All' is first)
+    years = tuple(filter_options['years'][1:])
+    year_min = min(years)
+    year_max = max(years)
+
+    # Dropdown specs: (label, id, options, z-index). The three columns only
+    # differ in these fields, so one loop builds them all. The subject list
+    # is an initial window only — the search callback streams in further
+    # matches as the user types.
+    dropdown_specs = (
+        ('Department', 'department-filter',
+         _label_value_options(tuple(filter_options['departments'])), 9999),
+        ('Semester', 'semester-filter',
+         _sem_options(tuple(filter_options['semesters'])), 9998),
+        ('Subject/Course', 'subject-filter',
+         _label_value_options(tuple(filter_options['subjects'][:SUBJECT_OPTIONS_LIMIT + 1])), 9997),
+    )
+
     return dbc.Card([
         dbc.CardBody([
             dbc.Row([
                 dbc.Col([
-                    html.Label("Department", className="fw-bold"),
-                    dcc.Dropdown(
-                        id='department-filter',
-                        options=[{'label': d, 'value': d} for d in filter_options['departments']],
-                        value='All',
-                        clearable=False,
-                        optionHeight=40,
-                        maxHeight=300,
-                        style={
-                            'zIndex': 9999
-                        }
-                    )
-                ], md=4, style={'position': 'relative', 'zIndex': 9999, 'overflow': 'visible'}),
-                dbc.Col([
-                    html.Label("Semester", className="fw-bold"),
-                    dcc.Dropdown(
-                        id='semester-filter',
-                        options=[{'label': ('All Semesters' if s == 'All' else f'Sem {s}'), 
-                                'value': s} for s in filter_options['semesters']],
-                        value='All',
-                        clearable=False,
-                        optionHeight=40,
-                        maxHeight=300,
-                        style={
-                            'zIndex': 9998
-                        }
-                    )
-                ], md=4, style={'position': 'relative', 'zIndex': 9998, 'overflow': 'visible'}),
-                dbc.Col([
-                    html.Label("Subject/Course", className="fw-bold"),
+                    html.Label(label, className=_FW_BOLD),
                     dcc.Dropdown(
-                        id='subject-filter',
-                        options=[{'label': s, 'value': s} for s in filter_options['subjects']],
+                        id=dropdown_id,
+                        options=options,
                         value='All',
                         clearable=False,
                         optionHeight=40,
                         maxHeight=300,
-                        style={
-                            'zIndex': 9997
-                        }
+                        className=f'filter-dd-z{z}'
                     )
-                ], md=4, style={'position': 'relative', 'zIndex': 9997, 'overflow': 'visible'}),
-            ], style={'overflow': 'visible'}),
+                ], md=4, className=f'filter-col-z{z}')
+                for label, dropdown_id, options, z in dropdown_specs
+            ]),
             dbc.Row([
                 dbc.Col([
                     html.Label("Year Range", className="fw-bold mt-3"),
                     dcc.RangeSlider(
                         id='year-range-slider',
-                        min=min(filter_options['years'][1:]),
-                        max=max(filter_options['years'][1:]),
-                        value=[min(filter_options['years'][1:]), max(filter_options['years'][1:])],
-                        marks={int(year): str(int(year)) for year in filter_options['years'][1:]},
+                        min=year_min,
+                        max=year_max,
+                        value=[year_min, year_max],
+                        marks=_year_marks(years),
                         step=1,
                         tooltip={"placement": "bottom", "always_visible": True}
                     )
                 ], md=10),
                 dbc.Col([
-                    html.Label("\u00A0", className="fw-bold mt-3"),
+                    _NBSP_LABEL,
                     dbc.Button(
                         "🔍 Search",
                         id='search-button',
                         color="primary",
                         className="w-100",
                         size="lg",
-                        style={'marginTop': '8px'}
+                        style=_SEARCH_BTN_STYLE
                     )
                 ], md=2, className="d-flex align-items-end")
-            ], style={'overflow': 'visible'})
-        ], style={'overflow': 'visible'})
-    ], className="mb-4 shadow-sm", style={
-        'position': 'relative', 
-        'zIndex': 100,
-        'overflow': 'visible',
-        'backgroundColor': COLORS['card'],
-        'border': 'none',
-        'borderRadius': '16px'
-    })
+            ])
+        ])
+    ], className="mb-4 shadow-sm", style=_FILTER_CARD_STYLE)
 
 
 def create_kpi_card(title, value_id, trend_id=None, color=None, border_color=None):
@@ -122,14 +183,10 @@ def create_kpi_card(title, value_id, trend_id=None, color=None, border_color=Non
     Returns:
         dbc.Col: Column containing KPI card
     """
-    card_style = {
-        'position': 'relative', 
-        'zIndex': 1,
-        'overflow': 'visible'
-    }
-    if border_color:
-        card_style['borderLeft'] = f'4px solid {border_color}'
-    
+    # Every style= below references a shared module-level dict so repeated
+    # layout builds hand Dash identical prop objects.
+    card_style = _kpi_card_style(border_color) if border_color else _KPI_CARD_STYLE_BASE
+
     card_body = [
         html.H6(title, className="text-muted"),
         html.H2(id=value_id, className=f"mb-0 {color}" if color else "mb-0"),
@@ -143,12 +200,28 @@ def create_kpi_card(title, value_id, trend_id=None, color=None, border_color=Non
     return dbc.Col(
         dbc.Card([
             dbc.CardBody(card_body)
-        ], className="shadow-sm", style={**card_style, 'backgroundColor': COLORS['card'], 'border': 'none', 'borderRadius': '16px'}),
+        ], className=_SHADOW_SM, style=card_style),
         md=3,
-        style={'position': 'relative', 'zIndex': 1}
+        style=_KPI_COL_STYLE
     )
 
 
+def create_kpi_cards(specs):
+    """
+    Build a row's worth of KPI cards from one spec sequence.
+
+    Args:
+        specs (iterable): Tuples of (title, value_id, trend_id, color, border_color)
+
+    Returns:
+        list: dbc.Col components, one per spec
+    """
+    return [
+        create_kpi_card(title, value_id, trend_id, color, border_color)
+        for title, value_id, trend_id, color, border_color in specs
+    ]
+
+
 def create_chart_card(title, chart_id, icon="📈"):
     """
     Create chart card component.
@@ -166,62 +239,68 @@ def create_chart_card(title, chart_id, icon="📈"):
             html.H5(f"{icon} {title}", className="mb-3"),
             dcc.Graph(id=chart_id, config={'displayModeBar': False})
         ])
-    ], className="shadow-sm", style={
-        'position': 'relative',
-        'zIndex': 1,
-        'backgroundColor': COLORS['card'],
-        'border': 'none',
-        'borderRadius': '16px'
-    })
+    ], className=_SHADOW_SM, style=_CHART_CARD_STYLE)
 
 
 def create_trend_indicator(current, previous, label="average", inverse_colors=False, unit="%"):
     """
     Create HTML trend indicator with descriptive label.
-    
+
     Args:
         current (float): Current value
         previous (float): Previous/comparison value
         label (str): Description label
         inverse_colors (bool): If True, decreasing is good (green), increasing is bad (red)
         unit (str): Suffix to display after the change (default '%')
-        
+
     Returns:
         html.Span: Trend indicator component
     """
     if current is None or previous is None:
-        return html.Span("→ N/A", style={'color': '#6b7280', 'fontSize': '0.875rem'})
+        return _NA_SPAN
 
     if previous == 0:
-        return html.Span("→ N/A", style={'color': '#6b7280', 'fontSize': '0.875rem'})
-    
-    change = current - previous
-    suffix = unit or ""
-    
-    # Determine colors based on inverse_colors flag
-    if inverse_colors:
-        good_color = '#10b981'  # green
-        bad_color = '#ef4444'   # red
-    else:
-        good_color = '#10b981'  # green
-        bad_color = '#ef4444'   # red
-    
+        return _NA_SPAN
+
+    # Unchanged values (typical right after load) skip the arithmetic path
+    # entirely and share one Span per (label, unit).
+    if current == previous:
+        return _flat_zero_span(label, unit or "")
+
+    # Only the delta is displayed, to one decimal — round it once (after
+    # differencing, so the two roundings can't drift the shown value or
+    # the flat-arrow threshold) and key the Span cache on those tenths.
+    return _trend_span(round((current - previous) * 10), label,
+                       inverse_colors, unit or "")
+
+
+@functools.lru_cache(maxsize=32)
+def _flat_zero_span(label, suffix):
+    """Build (and cache) the zero-change Span for a given label/suffix."""
+    return html.Span(f"→ +0.0{suffix} from {label}", style=_FLAT_STYLE)
+
+
+@functools.lru_cache(maxsize=256)
+def _trend_span(diff_tenths, label, inverse_colors, suffix):
+    """Build (and cache) the rendered trend Span for a rounded delta."""
+    change = diff_tenths / 10
+
+    # %-formatting skips the per-call format-opcode dispatch f-strings pay
+    # for float specs, which adds up across KPIs on every callback.
     if abs(change) < 0.5:
         return html.Span(
-            f"→ {change:+.1f}{suffix} from {label}",
-            style={'color': '#6b7280', 'fontSize': '0.875rem'}
+            "→ %+.1f%s from %s" % (change, suffix, label),
+            style=_FLAT_STYLE
         )
     elif change > 0:
-        color = bad_color if inverse_colors else good_color
         return html.Span(
-            f"↑ {change:+.1f}{suffix} from {label}",
-            style={'color': color, 'fontWeight': 'bold', 'fontSize': '0.875rem'}
+            "↑ %+.1f%s from %s" % (change, suffix, label),
+            style=_BAD_STYLE if inverse_colors else _GOOD_STYLE
         )
     else:
-        color = good_color if inverse_colors else bad_color
         return html.Span(
-            f"↓ {change:+.1f}{suffix} from {label}",
-            style={'color': color, 'fontWeight': 'bold', 'fontSize': '0.875rem'}
+            "↓ %+.1f%s from %s" % (change, suffix, label),
+            style=_GOOD_STYLE if inverse_colors else _BAD_STYLE
         )
 
 
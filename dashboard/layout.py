@@ -6,202 +6,151 @@ Dashboard layout definition.
 FIXES: Added overflow: visible to main container and rows
 """
 
+import functools
+
 import dash_bootstrap_components as dbc
 from dash import dcc, html
-from config import COLORS
 from .components import (
     create_filter_card,
-    create_kpi_card,
+    create_kpi_cards,
     create_chart_card
 )
 
+# Wrapper positioning/overflow styles live in assets/custom.css
+# (.layout-row, .layout-filter, .layout-container) so they ship as class
+# names instead of repeated inline style dicts.
+
+# KPI card specs: (title, value_id, trend_id, color, border_color)
+_KPI_CARD_SPECS = (
+    ("Unique Students", "kpi-total", None, None, None),
+    ("Pass Rate", "kpi-pass", "kpi-pass-trend", "text-success", "#10b981"),
+    ("Distinction Rate", "kpi-distinction", "kpi-distinction-trend", "text-warning", "#f59e0b"),
+    ("Failure Rate", "kpi-fail", "kpi-fail-trend", "text-danger", "#ef4444"),
+)
+
+_ASSESSMENT_KPI_SPECS = (
+    ("Avg CIA (Theory)", "kpi-cia-theory", "kpi-cia-theory-trend", None, "#2563eb"),
+    ("Avg ESE (Theory)", "kpi-ese-theory", "kpi-ese-theory-trend", None, "#0ea5e9"),
+    ("Avg CIA (Practical)", "kpi-cia-practical", "kpi-cia-practical-trend", None, "#f97316"),
+)
+
+
+# Chart card rows, one tuple of (title, chart_id, icon, md) per column.
+_TREND_CHART_ROWS = (
+    (("Year-over-Year Trends", "yoy-trends", "\U0001F4C8", 12),),
+    (("Department Performance Comparison", "dept-comparison", "\U0001F3E2", 12),),
+    (("Performance Distribution by Year", "distribution-chart", "\U0001F4CA", 12),),
+)
+
+_DETAIL_CHART_ROWS = (
+    (("Subject Difficulty Spotlight", "subject-difficulty-chart", "\U0001F9E0", 6),
+     ("Department Leaderboard", "dept-leaderboard-chart", "\U0001F3C5", 6)),
+    (("CIA vs ESE Trend", "assessment-trend", "\U0001F4C8", 12),),
+)
+
+
+def _chart_rows(rows):
+    """Render chart card rows from their specs.
+
+    Full-width rows skip the Row/Col pair entirely — a Col spanning md=12
+    adds a grid component without affecting layout.
+    """
+    rendered = []
+    for row in rows:
+        if len(row) == 1 and row[0][3] == 12:
+            title, chart_id, icon, _ = row[0]
+            rendered.append(html.Div(create_chart_card(title, chart_id, icon),
+                                     className="mb-4 layout-row"))
+        else:
+            rendered.append(dbc.Row([
+                dbc.Col(create_chart_card(title, chart_id, icon), md=md)
+                for title, chart_id, icon, md in row
+            ], className="mb-4 layout-row"))
+    return rendered
+
 
 def create_layout(filter_options):
     """
     Create the complete dashboard layout.
-    
+
+    The tree is a pure function of filter_options, so identical options
+    (e.g. across hot reloads) reuse the cached build.
+
     Args:
         filter_options (dict): Filter dropdown options
-        
+
     Returns:
         dbc.Container: Complete dashboard layout
     """
+    key = tuple(sorted((k, tuple(v)) for k, v in filter_options.items()))
+    return _create_layout_cached(key)
+
+
+@functools.lru_cache(maxsize=4)
+def _create_layout_cached(key):
+    """Build the layout tree once per distinct frozen filter_options key."""
+    filter_options = {k: list(v) for k, v in key}
     return dbc.Container([
-        # Loading overlay
-        dcc.Loading(
-            id="loading-main",
-            type="default",
-            fullscreen=True,
-            children=html.Div(id="loading-output")
-        ),
-        
+        # Compact KPI payload rendered client-side (see dashboard/callbacks.py)
+        dcc.Store(id='kpi-data'),
+
         # Header
-        dbc.Row(
-            dbc.Col([
-                html.H1("🎓 Pass Rate & Distinction Trend Analysis", 
-                       className="text-center my-4"),
-                html.P("Comprehensive year-over-year performance tracking across departments, programs, and courses",
-                       className="text-center text-muted mb-4")
-            ], width=12),
-            style={'position': 'relative', 'zIndex': 1}
-        ),
+        html.Header([
+            html.H1("🎓 Pass Rate & Distinction Trend Analysis",
+                    className="text-center my-4"),
+            html.P("Comprehensive year-over-year performance tracking across departments, programs, and courses",
+                   className="text-center text-muted mb-4")
+        ], className="layout-row"),
         
         # Filters - HIGHEST Z-INDEX
         html.Div(
             create_filter_card(filter_options),
-            style={'position': 'relative', 'zIndex': 100, 'overflow': 'visible'}
+            className="layout-filter"
         ),
         
-        # KPI Cards - LOWER Z-INDEX
-        dcc.Loading(
-            type="circle",
-            children=[
-                dbc.Row([
-                    create_kpi_card("Unique Students", "kpi-total"),
-                    create_kpi_card("Pass Rate", "kpi-pass", "kpi-pass-trend", 
-                                  "text-success", "#10b981"),
-                    create_kpi_card("Distinction Rate", "kpi-distinction", "kpi-distinction-trend",
-                                  "text-warning", "#f59e0b"),
-                    create_kpi_card("Failure Rate", "kpi-fail", "kpi-fail-trend",
-                                  "text-danger", "#ef4444"),
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
-            ]
-        ),
-
-        # Assessment KPI Cards
+        # KPI Cards (performance + assessment) - LOWER Z-INDEX.
+        # One Loading per visual region instead of one per row keeps the
+        # number of spinner subtrees React reconciles per update small.
         dcc.Loading(
             type="circle",
             children=[
-                dbc.Row([
-                    create_kpi_card("Avg CIA (Theory)", "kpi-cia-theory", "kpi-cia-theory-trend",
-                                    border_color="#2563eb"),
-                    create_kpi_card("Avg ESE (Theory)", "kpi-ese-theory", "kpi-ese-theory-trend",
-                                    border_color="#0ea5e9"),
-                    create_kpi_card("Avg CIA (Practical)", "kpi-cia-practical", "kpi-cia-practical-trend",
-                                    border_color="#f97316"),
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
+                dbc.Row(create_kpi_cards(_KPI_CARD_SPECS),
+                        className="mb-4 layout-row"),
+                dbc.Row(create_kpi_cards(_ASSESSMENT_KPI_SPECS),
+                        className="mb-4 layout-row"),
             ]
         ),
         
         # Alerts
-        dbc.Row(
-            dbc.Col(html.Div(id='alerts-section'), width=12), 
-            className="mb-3",
-            style={'position': 'relative', 'zIndex': 1}
-        ),
+        html.Div(id='alerts-section', className="mb-3 layout-row"),
         
-        # Year-over-Year Trends Chart
+        # Trend charts (YoY, department comparison, distribution)
         dcc.Loading(
             type="default",
-            children=[
-                dbc.Row([
-                    dbc.Col(create_chart_card(
-                        "Year-over-Year Trends", 
-                        "yoy-trends"
-                    ), md=12)
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
-            ]
-        ),
-        
-        # Department Comparison Chart
-        dcc.Loading(
-            type="default",
-            children=[
-                dbc.Row([
-                    dbc.Col(create_chart_card(
-                        "Department Performance Comparison",
-                        "dept-comparison",
-                        "🏢"
-                    ), md=12)
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
-            ]
-        ),
-        
-        # Distribution Chart
-        dcc.Loading(
-            type="default",
-            children=[
-                dbc.Row([
-                    dbc.Col(create_chart_card(
-                        "Performance Distribution by Year",
-                        "distribution-chart",
-                        "📊"
-                    ), md=12)
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
-            ]
-        ),
-
-        # Subject Difficulty & Department Leaderboard
-        dcc.Loading(
-            type="default",
-            children=[
-                dbc.Row([
-                    dbc.Col(create_chart_card(
-                        "Subject Difficulty Spotlight",
-                        "subject-difficulty-chart",
-                        "🧠"
-                    ), md=6),
-                    dbc.Col(create_chart_card(
-                        "Department Leaderboard",
-                        "dept-leaderboard-chart",
-                        "🏅"
-                    ), md=6)
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
-            ]
-        ),
-        
-        # Assessment Trend Chart
-        dcc.Loading(
-            type="default",
-            children=[
-                dbc.Row([
-                    dbc.Col(create_chart_card(
-                        "CIA vs ESE Trend",
-                        "assessment-trend",
-                        "📈"
-                    ), md=12)
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
-            ]
+            children=_chart_rows(_TREND_CHART_ROWS)
         ),
 
+        # Detail charts, table and recommendations
         # (Removed) Assessment Gap by Department chart
-
-        # Detailed Table
-        dcc.Loading(
-            type="default",
-            children=[
-                dbc.Row([
-                    dbc.Col(dbc.Card([
-                        dbc.CardBody([
-                            html.H5("📋 Detailed Performance Table", className="mb-3"),
-                            html.Div(id='detail-table')
-                        ])
-                    ], className="shadow-sm"), md=12)
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
-            ]
-        ),
-        
-        # Insights & Recommendations
         dcc.Loading(
             type="default",
-            children=[
-                dbc.Row([
-                    dbc.Col(dbc.Card([
-                        dbc.CardBody([
-                            html.H5("💡 Insights & Recommendations", className="mb-3"),
-                            html.Div(id='recommendations')
-                        ])
-                    ], className="shadow-sm bg-light"), md=12)
-                ], className="mb-4", style={'position': 'relative', 'zIndex': 1}),
+            children=_chart_rows(_DETAIL_CHART_ROWS) + [
+                html.Div(dbc.Card([
+                    dbc.CardBody([
+                        html.H5("📋 Detailed Performance Table", className="mb-3"),
+                        html.Div(id='detail-table')
+                    ])
+                ], className="shadow-sm"), className="mb-4 layout-row"),
+                html.Div(dbc.Card([
+                    dbc.CardBody([
+                        html.H5("💡 Insights & Recommendations", className="mb-3"),
+                        html.Div(id='recommendations')
+                    ])
+                ], className="shadow-sm bg-light"), className="mb-4 layout-row"),
             ]
         ),
         
-    ], fluid=True, style={
-        'backgroundColor': COLORS['background'],
-        'paddingBottom': '40px',
-        'overflow': 'visible',
-        'position': 'relative'
-    })
+    ], fluid=True, className="layout-container")
 
 
 
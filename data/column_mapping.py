@@ -6,54 +6,59 @@ Column mapping configuration for handling different CSV structures.
 Update this file when you receive new CSV with different column names.
 """
 
+import sys
+from types import MappingProxyType
+
 # ==============================================================================
 # COLUMN MAPPING CONFIGURATION
 # ==============================================================================
 # Map your CSV columns to standardized names
-# Format: 'standard_name': ['possible_name_1', 'possible_name_2', ...]
+# Format: 'standard_name': ('possible_name_1', 'possible_name_2', ...)
+# Read-only: aliases are tuples and the maps are MappingProxyType so the
+# import-time normalized index can never drift from the live config.
 
-COLUMN_MAPPINGS = {
-    'student_id': [
-        'student_id', 'studentid', 'student_code', 'roll_no', 
+COLUMN_MAPPINGS = MappingProxyType({
+    'student_id': (
+        'student_id', 'studentid', 'student_code', 'roll_no',
         'rollno', 'roll_number', 'enrollment_no', 'id'
-    ],
-    
-    'exam_year': [
+    ),
+
+    'exam_year': (
         'exam_year', 'year', 'academic_year', 'year_of_exam',
         'examination_year', 'exam_session'
-    ],
-    
-    'semester': [
+    ),
+
+    'semester': (
         'semester', 'sem', 'term', 'session', 'period'
-    ],
-    
-    'offering_department': [
+    ),
+
+    'offering_department': (
         'offering_department', 'department', 'dept', 'branch',
         'program', 'faculty', 'school'
-    ],
-    
-    'subject_name': [
+    ),
+
+    'subject_name': (
         'name', 'subject_name', 'course_name', 'subject',
         'course', 'subject_code', 'course_code', 'paper_name'
-    ],
-    
-    'grade_point': [
+    ),
+
+    'grade_point': (
         'grade_point', 'gpa', 'cgpa', 'marks', 'score',
         'grade', 'percentage', 'total_marks'
-    ],
-    
-    'course_result': [
+    ),
+
+    'course_result': (
         'course_result', 'result', 'status', 'outcome',
         'pass_fail', 'grade_status'
-    ]
-}
+    )
+})
 
 # ==============================================================================
 # DATA TYPE SPECIFICATIONS
 # ==============================================================================
 # Specify the expected data type for each standard column
 
-COLUMN_DTYPES = {
+COLUMN_DTYPES = MappingProxyType({
     'student_id': 'string',
     'exam_year': 'int',
     'semester': 'int',
@@ -61,14 +66,14 @@ COLUMN_DTYPES = {
     'subject_name': 'string',
     'grade_point': 'float',
     'course_result': 'string'
-}
+})
 
 # ==============================================================================
 # DEFAULT VALUES
 # ==============================================================================
 # Default values to use when data is missing
 
-DEFAULT_VALUES = {
+DEFAULT_VALUES = MappingProxyType({
     'student_id': 'UNKNOWN',
     'exam_year': 2024,
     'semester': 1,
@@ -76,57 +81,84 @@ DEFAULT_VALUES = {
     'subject_name': 'Unknown Subject',
     'grade_point': 0.0,
     'course_result': 'Fail'
-}
+})
 
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
+# Lowercase ASCII and map spaces to underscores in one C-level pass
+# instead of chaining .lower().replace() (three intermediate strings).
+_NORM_TABLE = str.maketrans(
+    {**{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)}, ' ': '_'}
+)
+
+
+def _normalize(name):
+    """Normalize a column name for case/spacing-insensitive comparison."""
+    return name.strip().translate(_NORM_TABLE)
+
+
+# Aliases normalized once at import; alias order is preserved so earlier
+# names in COLUMN_MAPPINGS still win when a CSV has several candidates.
+_NORMALIZED_ALIASES = {
+    standard_name: tuple(_normalize(alias) for alias in aliases)
+    for standard_name, aliases in COLUMN_MAPPINGS.items()
+}
+
+
+def _normalize_df_columns(df_columns):
+    """Map normalized CSV column names back to their original spelling."""
+    return {_normalize(col): col for col in df_columns}
+
+
 def find_column_match(df_columns, standard_name):
     """
     Find matching column name from CSV.
-    
+
     Args:
         df_columns (list): List of column names in the CSV
         standard_name (str): Standard column name to find
-        
+
     Returns:
         str or None: Matched column name or None
     """
-    possible_names = COLUMN_MAPPINGS.get(standard_name, [])
-    
-    # Normalize column names for comparison
-    normalized_df_cols = {col.lower().strip().replace(' ', '_'): col 
-                          for col in df_columns}
-    
-    for possible_name in possible_names:
-        normalized = possible_name.lower().strip().replace(' ', '_')
+    return _match_from_normalized(_normalize_df_columns(df_columns),
+                                  standard_name)
+
+
+def _match_from_normalized(normalized_df_cols, standard_name):
+    """Find a match against an already-normalized column lookup."""
+    for normalized in _NORMALIZED_ALIASES.get(standard_name, ()):
         if normalized in normalized_df_cols:
             return normalized_df_cols[normalized]
-    
+
     return None
 
 
 def get_column_mapping(df_columns):
     """
     Generate complete column mapping for a DataFrame.
-    
+
     Args:
         df_columns (list): List of column names in the CSV
-        
+
     Returns:
         dict: Mapping of standard names to actual CSV column names
     """
     mapping = {}
     missing = []
-    
+
+    # Normalize the CSV columns once instead of once per standard name
+    normalized_df_cols = _normalize_df_columns(df_columns)
+
     for standard_name in COLUMN_MAPPINGS.keys():
-        matched_col = find_column_match(df_columns, standard_name)
+        matched_col = _match_from_normalized(normalized_df_cols, standard_name)
         if matched_col:
             mapping[standard_name] = matched_col
         else:
             missing.append(standard_name)
-    
+
     return mapping, missing
 
 
@@ -138,21 +170,21 @@ def print_mapping_report(mapping, missing):
         mapping (dict): Successful mappings
         missing (list): Missing columns
     """
-    print("\n" + "="*60)
-    print("COLUMN MAPPING REPORT")
-    print("="*60)
-    
+    # Assemble the whole report first so stdout is hit once, not per line
+    lines = ["", "=" * 60, "COLUMN MAPPING REPORT", "=" * 60]
+
     if mapping:
-        print("\n✅ Successfully Mapped Columns:")
-        for std_name, csv_col in mapping.items():
-            print(f"   {std_name:20s} → {csv_col}")
-    
+        lines.append("\n✅ Successfully Mapped Columns:")
+        lines.extend(f"   {std_name:20s} → {csv_col}"
+                     for std_name, csv_col in mapping.items())
+
     if missing:
-        print("\n⚠️  Missing Columns (will use defaults):")
-        for col in missing:
-            print(f"   {col:20s} → Default: {DEFAULT_VALUES[col]}")
-    
-    print("\n" + "="*60 + "\n")
+        lines.append("\n⚠️  Missing Columns (will use defaults):")
+        lines.extend(f"   {col:20s} → Default: {DEFAULT_VALUES[col]}"
+                     for col in missing)
+
+    lines.append("\n" + "=" * 60 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ==============================================================================
@@ -8,6 +8,11 @@ Data processing and filtering utilities.
 import polars as pl
 from config import DISTINCTION_GRADE
 
+# Regex patterns for the result-column override checks, defined once at
+# module level so every call site shares the same compiled pattern.
+_NA_PATTERN = r"(?i)not\s*applicable|^na$"
+_FAIL_PATTERN = r"(?i)(fail|sus)"
+
 
 # ------------------------------------------------------------------------------
 # PERFORMANCE CLASSIFICATION
@@ -53,18 +58,24 @@ def add_performance_column(df: pl.DataFrame) -> pl.DataFrame:
     theory_pct = pl.col("theory_percentage").cast(pl.Float64, strict=False).fill_null(0)
     practical_pct = pl.col("practical_percentage").cast(pl.Float64, strict=False).fill_null(0)
     total_pct = theory_pct + practical_pct
-    
+
+    # Lowercase pass_fail once and reference it from both branches instead
+    # of re-running the UTF-8 pass per comparison; dropped again at the end.
+    df = df.with_columns(
+        pl.col("pass_fail")
+        .cast(pl.Utf8, strict=False)
+        .fill_null("")
+        .str.to_lowercase()
+        .alias("_pf_norm")
+    )
+
     # Base logic: Fail → Distinction (if >=80%) → Pass
     base_expr = (
-        pl.when(
-            pl.col("pass_fail").cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase().eq("fail")
-        )
+        pl.when(pl.col("_pf_norm").eq("fail"))
         .then(pl.lit("Fail"))
         .when(total_pct.ge(80))
         .then(pl.lit("Distinction"))
-        .when(
-            pl.col("pass_fail").cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase().eq("pass")
-        )
+        .when(pl.col("_pf_norm").eq("pass"))
         .then(pl.lit("Pass"))
         .otherwise(pl.lit(None))
     )
@@ -78,29 +89,39 @@ def add_performance_column(df: pl.DataFrame) -> pl.DataFrame:
         "practical_internal_result",
     ]
     
-    # Start with base expression
-    final_expr = base_expr
-    
-    # For each result column, if it contains "fail" or "sus" (and not "not applicable"),
-    # force performance to "Fail"
-    for col in result_columns:
-        if col in df.columns:
-            na_check = (
-                pl.col(col)
-                .cast(pl.Utf8, strict=False)
-                .fill_null("")
-                .str.contains("(?i)not\\s*applicable|^na$")
-            )
-            fail_check = (
-                pl.col(col)
-                .fill_null("")
-                .str.contains("(?i)(fail|sus)")
-            )
-            # If column has fail and is not NA, override to Fail
-            final_expr = pl.when(~na_check & fail_check).then(pl.lit("Fail")).otherwise(final_expr)
-    
-    df = df.with_columns(final_expr.alias("performance"))
-    
+    # If any result column contains "fail" or "sus" (and not "not applicable"),
+    # force performance to "Fail". One horizontal OR-reduce over the present
+    # columns replaces the previous nested when-chain.
+    present_result_cols = [col for col in result_columns if col in df.columns]
+
+    if present_result_cols:
+        any_fail = pl.any_horizontal([
+            ~pl.col(col)
+            .cast(pl.Utf8, strict=False)
+            .fill_null("")
+            .str.contains(_NA_PATTERN)
+            & pl.col(col)
+            .fill_null("")
+            .str.contains(_FAIL_PATTERN)
+            for col in present_result_cols
+        ])
+        final_expr = pl.when(any_fail).then(pl.lit("Fail")).otherwise(base_expr)
+    else:
+        final_expr = base_expr
+
+    # Categorical so the repeated `== 'Distinction'` / `== 'Pass'` checks
+    # downstream compare u32 codes rather than UTF-8 bytes. A closed Enum
+    # would be marginally tighter but raises on unseen literals, and the
+    # API filters this column by arbitrary user-supplied strings.
+    df = df.with_columns(
+        final_expr.cast(pl.Categorical("lexical")).alias("performance")
+    )
+    # Boolean companion for the summaries, mirroring is_pass/is_fail from
+    # the loader: distinction counts reduce over a bitmap
+    df = df.with_columns(
+        pl.col("performance").eq("Distinction").alias("is_dist")
+    ).drop("_pf_norm")
+
     return df
 
 
@@ -109,17 +130,21 @@ def add_performance_column(df: pl.DataFrame) -> pl.DataFrame:
 # ------------------------------------------------------------------------------
 
 def filter_data(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     year_range=None,
     department: str = "All",
     semester: str | int = "All",
     subject: str = "All",
-) -> pl.DataFrame:
+) -> pl.DataFrame | pl.LazyFrame:
     """
     Safely filter DataFrame based on user selections.
     Handles all edge cases (type mismatches, empty filters, etc.)
+
+    The active conditions are combined into one predicate and applied in a
+    single `filter` call, so the frame is scanned once; on a LazyFrame the
+    predicate additionally pushes down to the scan.
     """
-    filtered = df.clone()
+    predicates = []
 
     # ---- Year Range ----
     if (
@@ -127,7 +152,7 @@ def filter_data(
         and len(year_range) >= 2
         and all(isinstance(y, (int, float)) for y in year_range)
     ):
-        filtered = filtered.filter(
+        predicates.append(
             (pl.col("exam_year") >= year_range[0])
             & (pl.col("exam_year") <= year_range[1])
         )
@@ -135,27 +160,33 @@ def filter_data(
         # Fallback for a single year value
         try:
             yr = int(year_range[0]) if isinstance(year_range, (list, tuple)) else int(year_range)
-            filtered = filtered.filter(pl.col("exam_year") == yr)
+            predicates.append(pl.col("exam_year") == yr)
         except Exception:
             print(f"[WARN] Invalid year_range '{year_range}' — skipping year filter.")
 
     # ---- Department ----
     if department and department != "All":
-        filtered = filtered.filter(pl.col("department") == department)
+        predicates.append(pl.col("department") == department)
 
     # ---- Semester ----
     if semester not in ("All", None, ""):
         try:
-            semester_num = int(semester)
-            filtered = filtered.filter(pl.col("semester") == semester_num)
+            predicates.append(pl.col("semester") == int(semester))
         except Exception:
             print(f"[WARN] Semester value '{semester}' not numeric — skipping semester filter.")
 
     # ---- Subject ----
     if subject and subject != "All":
-        filtered = filtered.filter(pl.col("subject") == subject)
+        predicates.append(pl.col("subject") == subject)
 
-    return filtered
+    if not predicates:
+        return df
+
+    combined = predicates[0]
+    for pred in predicates[1:]:
+        combined = combined & pred
+
+    return df.filter(combined)
 
 
 # ------------------------------------------------------------------------------
@@ -163,20 +194,31 @@ def filter_data(
 # ------------------------------------------------------------------------------
 
 def get_filter_options(df: pl.DataFrame) -> dict:
-    """Get unique values for all filter dropdowns."""
+    """Get unique values for all filter dropdowns.
+
+    All four uniques run in one `select` so Polars computes them in
+    parallel across columns instead of four separate passes.
+    """
+    opts = df.lazy().select([
+        pl.col("subject").unique().implode().alias("subjects"),
+        pl.col("exam_year").unique().implode().alias("years"),
+        pl.col("department").unique().implode().alias("departments"),
+        pl.col("semester").unique().implode().alias("semesters"),
+    ]).collect()
+
     try:
         subjects = sorted(
-            [subj for subj in df["subject"].unique().to_list() if subj not in (None, "")]
+            [subj for subj in opts["subjects"][0].to_list() if subj not in (None, "")]
         )
     except Exception:
         subjects = []
 
-    years = [year for year in df["exam_year"].unique().to_list() if year is not None]
+    years = [year for year in opts["years"][0].to_list() if year is not None]
     departments = [
-        dept for dept in df["department"].unique().to_list() if dept not in (None, "")
+        dept for dept in opts["departments"][0].to_list() if dept not in (None, "")
     ]
     semesters = [
-        sem for sem in df["semester"].unique().to_list() if sem is not None
+        sem for sem in opts["semesters"][0].to_list() if sem is not None
     ]
 
     return {
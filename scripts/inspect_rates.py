@@ -30,15 +30,13 @@ def main():
                 .alias("pass_fail_norm")
             )
             .to_series()
-            .value_counts()
+            .value_counts(sort=True)
         )
-        print({str(k): int(v) for k, v in zip(pf_counts["pass_fail_norm"], pf_counts["counts"])})
+        print({str(row[0]): int(row[1]) for row in pf_counts.iter_rows()})
 
     print("\nperformance value_counts:")
     perf_counts = (
-        df.group_by(pl.col("performance").cast(pl.Utf8, strict=False).alias("performance"))
-        .agg(pl.count().alias("cnt"))
-        .sort("cnt", descending=True)
+        df.get_column("performance").cast(pl.Utf8, strict=False).value_counts(sort=True)
     )
     print({str(row[0]): int(row[1]) for row in perf_counts.iter_rows()})
 
@@ -52,11 +50,7 @@ def main():
     ]:
         if c in df.columns:
             print(f"\n{c} value_counts:")
-            s = (
-                df.group_by(pl.col(c).cast(pl.Utf8, strict=False).alias(c))
-                .agg(pl.count().alias("cnt"))
-                .sort("cnt", descending=True)
-            )
+            s = df.get_column(c).cast(pl.Utf8, strict=False).value_counts(sort=True)
             print({str(row[0]): int(row[1]) for row in s.iter_rows()})
 
     print("\nComputed rates (pass, distinction, fail, unique_students, total_exams):")
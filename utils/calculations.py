@@ -6,8 +6,97 @@ Performance calculation utilities.
 Statistical computations and rate calculations.
 """
 
+import functools
+
 import polars as pl
 
+# Frames above this estimated size are aggregated through Polars' streaming
+# engine so the group_by passes stay memory-bounded instead of materializing
+# all intermediate state in RAM.
+STREAMING_SIZE_GB = 2
+STREAMING_CHUNK_SIZE = 500_000
+
+
+def _use_streaming(df: pl.DataFrame) -> bool:
+    """Decide whether a frame is large enough to warrant streaming collection."""
+    if df.estimated_size('gb') > STREAMING_SIZE_GB:
+        pl.Config.set_streaming_chunk_size(STREAMING_CHUNK_SIZE)
+        return True
+    return False
+
+
+def _as_lazy(df) -> tuple[pl.LazyFrame, bool]:
+    """Accept an eager or lazy frame; return the lazy view plus the
+    streaming decision (only an eager frame can be sized up front)."""
+    if isinstance(df, pl.DataFrame):
+        return df.lazy(), _use_streaming(df)
+    return df, False
+
+
+# Summaries are pure functions of their frame, and the dashboard re-runs
+# them against the same base frame on every callback. Keep the last few
+# results keyed on frame identity; the cached entry holds a reference to
+# its frame so the id cannot be recycled while the entry is alive.
+_FRAME_MEMO_SIZE = 4
+
+
+def _memoize_by_frame(func):
+    cache = {}
+
+    @functools.wraps(func)
+    def wrapper(df, *args, **kwargs):
+        if not isinstance(df, pl.DataFrame) or kwargs:
+            return func(df, *args, **kwargs)
+        key = (id(df), args)
+        hit = cache.get(key)
+        if hit is not None and hit[0] is df:
+            return hit[1]
+        result = func(df, *args, **kwargs)
+        if len(cache) >= _FRAME_MEMO_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = (df, result)
+        return result
+
+    return wrapper
+
+
+def _with_pf_norm(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Ensure a `_pass_fail_norm` column exists.
+
+    The loader pre-normalizes pass_fail into `_pass_fail_norm` (Categorical),
+    so on loader-produced frames this is a no-op; frames built elsewhere
+    (sample data, tests) get the column computed on the fly."""
+    if '_pass_fail_norm' in lf.columns:
+        return lf
+    return lf.with_columns(
+        pl.col('pass_fail')
+        .cast(pl.Utf8, strict=False)
+        .fill_null("")
+        .str.to_lowercase()
+        .alias('_pass_fail_norm')
+    )
+
+
+def _with_pass_flags(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Ensure boolean `is_pass` / `is_fail` columns exist.
+
+    The loader materializes both flags, so summing a packed bitmap replaces
+    a string/categorical equality over every row; frames built elsewhere
+    get them derived from `_pass_fail_norm` on the fly."""
+    if 'is_pass' in lf.columns and 'is_fail' in lf.columns:
+        return lf
+    return _with_pf_norm(lf).with_columns([
+        (pl.col('_pass_fail_norm') == 'pass').alias('is_pass'),
+        (pl.col('_pass_fail_norm') == 'fail').alias('is_fail'),
+    ])
+
+
+def _dist_expr(lf: pl.LazyFrame) -> pl.Expr:
+    """Boolean distinction expression, preferring the precomputed flag."""
+    if 'is_dist' in lf.columns:
+        return pl.col('is_dist')
+    return pl.col('performance') == 'Distinction'
+
 
 def calculate_rates(data):
     """
@@ -21,18 +110,23 @@ def calculate_rates(data):
     """
     if len(data) == 0:
         return 0, 0, 0, 0, 0
-    
-    unique_students = data['student_id'].n_unique()
-    total_exams = len(data)
-    
-    # Pass/Fail rates use pass_fail column directly
-    pass_fail_norm = data['pass_fail'].cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase()
-    pass_count = (pass_fail_norm == 'pass').sum()
-    fail_count = (pass_fail_norm == 'fail').sum()
-    
-    # Distinction rate uses performance column (based on combined percentage >= 80%)
-    dist_count = (data['performance'] == 'Distinction').sum()
-    
+
+    # All five reductions run in one fused select instead of a separate
+    # pass per scalar. Pass/Fail rates use the pass_fail column directly;
+    # distinction uses performance (combined percentage >= 80%).
+    lf = _with_pass_flags(data.lazy())
+    unique_students, total_exams, pass_count, fail_count, dist_count = (
+        lf.select([
+            pl.col('student_id').n_unique().alias('unique_students'),
+            pl.count().alias('total_exams'),
+            pl.col('is_pass').sum().alias('pass_count'),
+            pl.col('is_fail').sum().alias('fail_count'),
+            _dist_expr(lf).sum().alias('dist_count'),
+        ])
+        .collect()
+        .row(0)
+    )
+
     pass_rate = (pass_count / total_exams * 100) if total_exams > 0 else 0
     dist_rate = (dist_count / total_exams * 100) if total_exams > 0 else 0
     fail_rate = (fail_count / total_exams * 100) if total_exams > 0 else 0
@@ -40,107 +134,142 @@ def calculate_rates(data):
     return pass_rate, dist_rate, fail_rate, unique_students, total_exams
 
 
-def get_yearly_data(df):
-    """
-    Calculate year-over-year performance metrics.
-    
-    Args:
-        df (pl.DataFrame): Input DataFrame
-        
-    Returns:
-        pl.DataFrame: Aggregated yearly statistics
-    """
-    # Normalize pass_fail column for pass/fail counts
-    pass_fail_norm = df['pass_fail'].cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase()
-    
-    yearly_data = (df
-        .with_columns(pass_fail_norm.alias('_pass_fail_norm'))
+def _yearly_data_plan(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Build the (uncollected) yearly-metrics query."""
+    lf = _with_pass_flags(lf)
+    return (lf
         .group_by('exam_year')
         .agg([
             pl.col('student_id').n_unique().alias('unique_students'),
             pl.count().alias('total_exams'),
-            (pl.col('_pass_fail_norm') == 'pass').sum().alias('pass_count'),
-            (pl.col('performance') == 'Distinction').sum().alias('dist_count'),
-            (pl.col('_pass_fail_norm') == 'fail').sum().alias('fail_count')
+            pl.col('is_pass').sum().alias('pass_count'),
+            _dist_expr(lf).sum().alias('dist_count'),
+            pl.col('is_fail').sum().alias('fail_count')
         ])
         .with_columns([
             pl.col('exam_year').cast(pl.Int32, strict=False),
+            # Fixed integer dtypes so downstream row iteration yields plain ints
+            pl.col('unique_students').cast(pl.UInt32),
+            pl.col('total_exams').cast(pl.UInt32),
             (pl.col('pass_count') / pl.col('total_exams') * 100).alias('pass_rate'),
             (pl.col('dist_count') / pl.col('total_exams') * 100).alias('dist_rate'),
             (pl.col('fail_count') / pl.col('total_exams') * 100).alias('fail_rate')
         ])
         .sort('exam_year')
     )
-    
-    return yearly_data
 
 
-def get_department_stats(df, top_n=10):
+@_memoize_by_frame
+def get_yearly_data(df):
     """
-    Calculate department-wise performance statistics.
-    
+    Calculate year-over-year performance metrics.
+
     Args:
         df (pl.DataFrame): Input DataFrame
-        top_n (int): Number of top departments to return
-        
+
     Returns:
-        pl.DataFrame: Department statistics
+        pl.DataFrame: Aggregated yearly statistics
     """
-    # Normalize pass_fail for accurate pass count
-    pass_fail_norm = df['pass_fail'].cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase()
-    
-    dept_stats = (df.with_columns(pass_fail_norm.alias('_pass_fail_norm'))
+    lf, streaming = _as_lazy(df)
+    return _yearly_data_plan(lf).collect(streaming=streaming)
+
+
+def _department_stats_plan(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Build the (uncollected) department-statistics query."""
+    return (_with_pass_flags(lf)
         .group_by('department')
         .agg([
             pl.col('student_id').n_unique().alias('students'),
             pl.count().alias('exams'),
-            (pl.col('_pass_fail_norm') == 'pass').sum().alias('pass_count')
+            pl.col('is_pass').sum().alias('pass_count')
         ])
         .with_columns(
             (pl.col('pass_count') / pl.col('exams') * 100).alias('pass_rate')
         )
         .sort('pass_rate')
     )
-    return dept_stats
 
 
-def get_subject_difficulty(df: pl.DataFrame, top_n: int = 15) -> pl.DataFrame:
+@_memoize_by_frame
+def get_department_stats(df, top_n=10):
     """
-    Calculate subject difficulty metrics. Lower average marks imply higher difficulty.
-    Uses theory marks as the basis for difficulty ranking (higher marks = easier subject).
+    Calculate department-wise performance statistics.
+
+    Args:
+        df (pl.DataFrame): Input DataFrame
+        top_n (int): Number of top departments to return
+
+    Returns:
+        pl.DataFrame: Department statistics
     """
+    lf, streaming = _as_lazy(df)
+    return _department_stats_plan(lf).collect(streaming=streaming)
+
+
+def _difficulty_score_col(columns) -> str | None:
+    """Pick the difficulty score column, preferring processed totals."""
     # Priority: use total marks (theory + practical combined), fall back to theory only
-    score_col = None
     for col in ["total_theory_marks", "cia_theory_avg", "theory_percentage", "ese_theory_internal"]:
-        if col in df.columns:
-            score_col = col
-            break
+        if col in columns:
+            return col
+    return None
+
+
+def _subject_difficulty_plan(lf: pl.LazyFrame) -> pl.LazyFrame | None:
+    """Build the (uncollected) subject-difficulty query.
+
+    Returns None when no usable score column exists."""
+    score_col = _difficulty_score_col(lf.columns)
     if score_col is None:
-        return pl.DataFrame([])
+        return None
 
     subject_col = "subject"
 
-    # Normalize pass_fail for accurate pass rate
-    pass_fail_norm = df['pass_fail'].cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase()
-    
-    difficulty = (
-        df.with_columns(pass_fail_norm.alias('_pass_fail_norm'))
-        .filter(pl.col(subject_col).is_not_null())
-        .filter(pl.col(score_col).is_not_null())  # Only include subjects with marks data
+    # Filter ahead of the pass-flag materialization so any backfilled
+    # columns are only computed for rows that reach the aggregation
+    lf = lf.filter(
+        pl.col(subject_col).is_not_null()
+        & pl.col(score_col).is_not_null()  # Only include subjects with marks data
+    )
+
+    return (
+        _with_pass_flags(lf)
         .group_by(subject_col)
         .agg([
             pl.col(score_col).mean().alias("avg_total_marks"),
             pl.count().alias("exam_count"),
-            (pl.col('_pass_fail_norm') == 'pass')
-            .cast(pl.Float64, strict=False)
-            .mean()
-            .alias("pass_rate_raw"),
+            # Explicit cast: bool mean inside a group_by agg truncates to
+            # int on this polars version
+            pl.col('is_pass').cast(pl.Float64).mean().alias("pass_rate_raw"),
+        ])
+        .with_columns([
+            (pl.col("pass_rate_raw") * 100).alias("pass_rate"),
+            # API routes run substring searches on this small aggregate, so
+            # hand back plain strings even when the source is Categorical
+            pl.col(subject_col).cast(pl.Utf8),
         ])
-        .with_columns((pl.col("pass_rate_raw") * 100).alias("pass_rate"))
         .drop("pass_rate_raw")
         .sort("avg_total_marks", descending=False)
     )
-    return difficulty
+
+
+@_memoize_by_frame
+def get_subject_difficulty(df: pl.DataFrame, top_n: int = 15) -> pl.DataFrame:
+    """
+    Calculate subject difficulty metrics. Lower average marks imply higher difficulty.
+    Uses theory marks as the basis for difficulty ranking (higher marks = easier subject).
+    """
+    lf, streaming = _as_lazy(df)
+    plan = _subject_difficulty_plan(lf)
+    if plan is None:
+        return pl.DataFrame([])
+    if isinstance(df, pl.DataFrame):
+        score_col = _difficulty_score_col(df.columns)
+        # Null-count check is a bitmap popcount; when no row carries a
+        # score the whole group_by is skipped, keeping only the schema
+        if df.get_column(score_col).null_count() == df.height:
+            return plan.head(0).collect()
+    return plan.collect(streaming=streaming)
 
 
 def get_department_leaderboard(df: pl.DataFrame, top_n: int = 5) -> dict:
@@ -148,34 +277,46 @@ def get_department_leaderboard(df: pl.DataFrame, top_n: int = 5) -> dict:
     if stats.height == 0:
         return {}
 
-    top = stats.sort("pass_rate", descending=True).head(top_n).with_columns(
-        pl.lit("Top").alias("category")
+    # Rank once and slice both ends of it, instead of separate sorted
+    # passes for top, bottom and the concatenated view
+    n = stats.height
+    ranked = stats.with_columns(
+        pl.col("pass_rate").rank(method="ordinal", descending=True).alias("_rank")
     )
-    bottom = stats.sort("pass_rate").head(top_n).with_columns(
+    in_top = pl.col("_rank") <= top_n
+    in_bottom = pl.col("_rank") > n - top_n
+
+    top = ranked.filter(in_top).sort("pass_rate", descending=True).with_columns(
+        pl.lit("Top").alias("category")
+    ).drop("_rank")
+    bottom = ranked.filter(in_bottom).sort("pass_rate").with_columns(
         pl.lit("Bottom").alias("category")
+    ).drop("_rank")
+    # Departments in both slices (fewer than 2*top_n departments) are
+    # labelled once as "Top" rather than duplicated
+    combined = (
+        ranked.filter(in_top | in_bottom)
+        .with_columns(
+            pl.when(in_top)
+            .then(pl.lit("Top"))
+            .otherwise(pl.lit("Bottom"))
+            .alias("category")
+        )
+        .drop("_rank")
+        .sort("pass_rate")
     )
-    combined = pl.concat([bottom, top]).sort("pass_rate")
     return {
         "top": top,
         "bottom": bottom,
         "combined": combined
     }
 
-def get_assessment_yearly_summary(df: pl.DataFrame) -> pl.DataFrame:
-    """
-    Aggregate CIA and ESE metrics by academic year.
-    
-    For practical metrics, only includes records where practical_credit > 0
-    (theory-only subjects are excluded from practical averages).
-
-    Args:
-        df (pl.DataFrame): Input DataFrame with percentage columns.
+def _assessment_yearly_plan(lf: pl.LazyFrame) -> pl.LazyFrame | None:
+    """Build the (uncollected) yearly CIA/ESE summary query.
 
-    Returns:
-        pl.DataFrame: Yearly averages for CIA and ESE scores.
-    """
-    if "exam_year" not in df.columns:
-        raise ValueError("Missing required column: 'exam_year'")
+    Returns None when `exam_year` is missing."""
+    if "exam_year" not in lf.columns:
+        return None
 
     column_variants = {
         "cia_theory": [
@@ -202,7 +343,7 @@ def get_assessment_yearly_summary(df: pl.DataFrame) -> pl.DataFrame:
 
     def pick(col_list: list[str]) -> str | None:
         for name in col_list:
-            if name in df.columns:
+            if name in lf.columns:
                 return name
         return None
 
@@ -211,91 +352,109 @@ def get_assessment_yearly_summary(df: pl.DataFrame) -> pl.DataFrame:
     ese_theory_col = pick(column_variants["ese_theory"])
     ese_practical_col = pick(column_variants["ese_practical"])
 
-    # For practical metrics, filter to only records with practical_credit > 0
-    df_with_prac = df
-    if 'practical_credit' in df.columns:
-        df_with_prac = df.filter(pl.col('practical_credit').cast(pl.Float64, strict=False) > 0)
-
-    agg_exprs = []
-    if cia_theory_col:
-        agg_exprs.append(
-            pl.col(cia_theory_col)
+    # For practical metrics, only records with practical_credit > 0 count;
+    # the mask is applied inside the aggregation so theory and practical
+    # averages come out of one group_by pass instead of two plus a join
+    prac_filter = None
+    if 'practical_credit' in lf.columns:
+        prac_filter = pl.col('practical_credit').cast(pl.Float64, strict=False) > 0
+
+    def as_float(col_name: str) -> pl.Expr:
+        # Loader-produced frames carry these columns as floats already;
+        # the string round-trip only runs for raw Utf8 input where
+        # "Not Applicable" sentinels may still be embedded
+        if lf.schema[col_name] in pl.NUMERIC_DTYPES:
+            return pl.col(col_name)
+        return (
+            pl.col(col_name)
             .cast(pl.Utf8, strict=False)
             .str.replace_all(r'(?i)not applicable', '')
             .cast(pl.Float64, strict=False)
-            .mean()
-            .alias("cia_theory_avg")
         )
+
+    def masked(expr: pl.Expr) -> pl.Expr:
+        if prac_filter is not None:
+            expr = expr.filter(prac_filter)
+        return expr
+
+    agg_exprs = []
+    if cia_theory_col:
+        agg_exprs.append(as_float(cia_theory_col).mean().alias("cia_theory_avg"))
     else:
         agg_exprs.append(pl.lit(None).alias("cia_theory_avg"))
 
-    # For practical, use filtered dataframe to exclude theory-only courses
+    # For practical, mask to practical_credit > 0 to exclude theory-only courses
     if cia_practical_col:
-        cia_prac_expr = (
-            pl.col(cia_practical_col)
-            .cast(pl.Utf8, strict=False)
-            .str.replace_all(r'(?i)not applicable', '')
-            .cast(pl.Float64, strict=False)
-            .mean()
-            .alias("cia_practical_avg")
+        agg_exprs.append(
+            masked(as_float(cia_practical_col)).mean().alias("cia_practical_avg")
         )
     else:
-        cia_prac_expr = pl.lit(None).alias("cia_practical_avg")
+        agg_exprs.append(pl.lit(None).alias("cia_practical_avg"))
 
     if ese_theory_col:
-        agg_exprs.append(pl.col(ese_theory_col).cast(pl.Float64, strict=False).mean().alias("ese_theory_avg"))
+        agg_exprs.append(as_float(ese_theory_col).mean().alias("ese_theory_avg"))
     else:
         agg_exprs.append(pl.lit(None).alias("ese_theory_avg"))
 
     if ese_practical_col:
-        ese_prac_expr = pl.col(ese_practical_col).cast(pl.Float64, strict=False).mean().alias("ese_practical_avg")
+        agg_exprs.append(
+            masked(as_float(ese_practical_col)).mean().alias("ese_practical_avg")
+        )
     else:
-        ese_prac_expr = pl.lit(None).alias("ese_practical_avg")
-
-    # Aggregate theory metrics using full dataframe
-    summary_theory = (
-        df.group_by("exam_year")
+        agg_exprs.append(pl.lit(None).alias("ese_practical_avg"))
+
+    # One group_by pass produces all four averages; the gap columns are
+    # added on the (tiny) aggregated result. The null-filled averages are
+    # bound once so common-subexpression elimination runs each fill_null
+    # kernel a single time across the four derived columns.
+    ct = pl.col("cia_theory_avg").fill_null(0)
+    cp = pl.col("cia_practical_avg").fill_null(0)
+    et = pl.col("ese_theory_avg").fill_null(0)
+    ep = pl.col("ese_practical_avg").fill_null(0)
+
+    return (
+        lf.group_by("exam_year")
         .agg(agg_exprs)
         .with_columns(pl.col("exam_year").cast(pl.Int32, strict=False))
         .sort("exam_year")
+        .with_columns(
+            [
+                ((ct + cp) / 2).alias("cia_overall_avg"),
+                ((et + ep) / 2).alias("ese_overall_avg"),
+                (et - ct).alias("theory_gap"),
+                (ep - cp).alias("practical_gap"),
+            ]
+        )
     )
-    
-    # Aggregate practical metrics using filtered dataframe (practical_credit > 0)
-    summary_practical = (
-        df_with_prac.group_by("exam_year")
-        .agg([cia_prac_expr, ese_prac_expr])
-        .with_columns(pl.col("exam_year").cast(pl.Int32, strict=False))
-        .sort("exam_year")
-    )
-    
-    # Join the two summaries
-    summary = summary_theory.join(summary_practical, on="exam_year", how="left")
-    
-    # Add gap calculations (fill nulls with 0 to prevent null subtraction errors)
-    summary = summary.with_columns(
-        [
-            ((pl.col("cia_theory_avg").fill_null(0) + pl.col("cia_practical_avg").fill_null(0)) / 2).alias("cia_overall_avg"),
-            ((pl.col("ese_theory_avg").fill_null(0) + pl.col("ese_practical_avg").fill_null(0)) / 2).alias("ese_overall_avg"),
-            (pl.col("ese_theory_avg").fill_null(0) - pl.col("cia_theory_avg").fill_null(0)).alias("theory_gap"),
-            (pl.col("ese_practical_avg").fill_null(0) - pl.col("cia_practical_avg").fill_null(0)).alias("practical_gap"),
-        ]
-    )
-    return summary
 
 
-def get_assessment_department_summary(df: pl.DataFrame, top_n: int = 12) -> pl.DataFrame:
+@_memoize_by_frame
+def get_assessment_yearly_summary(df: pl.DataFrame) -> pl.DataFrame:
     """
-    Aggregate CIA vs ESE metrics by department.
+    Aggregate CIA and ESE metrics by academic year.
+
+    For practical metrics, only includes records where practical_credit > 0
+    (theory-only subjects are excluded from practical averages).
 
     Args:
         df (pl.DataFrame): Input DataFrame with percentage columns.
-        top_n (int): Number of departments to return.
 
     Returns:
-        pl.DataFrame: Department-level assessment summary.
+        pl.DataFrame: Yearly averages for CIA and ESE scores.
     """
-    if "department" not in df.columns:
-        raise ValueError("Missing required column: 'department'")
+    lf, streaming = _as_lazy(df)
+    plan = _assessment_yearly_plan(lf)
+    if plan is None:
+        raise ValueError("Missing required column: 'exam_year'")
+    return plan.collect(streaming=streaming)
+
+
+def _assessment_department_plan(lf: pl.LazyFrame, top_n: int = 12) -> pl.LazyFrame | None:
+    """Build the (uncollected) department CIA/ESE summary query.
+
+    Returns None when `department` is missing."""
+    if "department" not in lf.columns:
+        return None
 
     column_variants = {
         "cia_theory": [
@@ -322,7 +481,7 @@ def get_assessment_department_summary(df: pl.DataFrame, top_n: int = 12) -> pl.D
 
     def pick(col_list: list[str]) -> str | None:
         for name in col_list:
-            if name in df.columns:
+            if name in lf.columns:
                 return name
         return None
 
@@ -332,10 +491,13 @@ def get_assessment_department_summary(df: pl.DataFrame, top_n: int = 12) -> pl.D
     ese_practical_col = pick(column_variants["ese_practical"])
 
     agg_exprs = [pl.count().alias("exam_count")]
-    
-    # Helper to handle "Not Applicable" strings
+
+    # Helper to handle "Not Applicable" strings; columns the loader already
+    # delivered as floats skip the Utf8 round-trip entirely
     def safe_float(col_name):
         if col_name:
+            if lf.schema[col_name] in pl.NUMERIC_DTYPES:
+                return pl.col(col_name).mean()
             return (
                 pl.col(col_name)
                 .cast(pl.Utf8, strict=False)
@@ -350,8 +512,8 @@ def get_assessment_department_summary(df: pl.DataFrame, top_n: int = 12) -> pl.D
     agg_exprs.append(safe_float(cia_practical_col).alias("cia_practical_avg"))
     agg_exprs.append(safe_float(ese_practical_col).alias("ese_practical_avg"))
 
-    summary = (
-        df.group_by("department")
+    return (
+        lf.group_by("department")
         .agg(agg_exprs)
         .with_columns(
             [
@@ -362,4 +524,49 @@ def get_assessment_department_summary(df: pl.DataFrame, top_n: int = 12) -> pl.D
         .sort("exam_count", descending=True)
         .head(top_n)
     )
-    return summary
\ No newline at end of file
+
+
+@_memoize_by_frame
+def get_assessment_department_summary(df: pl.DataFrame, top_n: int = 12) -> pl.DataFrame:
+    """
+    Aggregate CIA vs ESE metrics by department.
+
+    Args:
+        df (pl.DataFrame): Input DataFrame with percentage columns.
+        top_n (int): Number of departments to return.
+
+    Returns:
+        pl.DataFrame: Department-level assessment summary.
+    """
+    lf, streaming = _as_lazy(df)
+    plan = _assessment_department_plan(lf, top_n)
+    if plan is None:
+        raise ValueError("Missing required column: 'department'")
+    return plan.collect(streaming=streaming)
+
+
+@_memoize_by_frame
+def compute_all(df: pl.DataFrame) -> dict:
+    """Collect the dashboard's five summaries in one scheduler pass.
+
+    Building all plans lazily and handing them to `pl.collect_all` lets
+    the query engine run the group_bys in parallel threads and share the
+    common projections (pass flags, scanned columns) between them, instead
+    of five serial collects from Python.
+
+    Returns a dict keyed by summary name; summaries whose required columns
+    are missing come back as empty DataFrames.
+    """
+    lf, streaming = _as_lazy(df)
+    plans = {
+        "yearly": _yearly_data_plan(lf),
+        "department_stats": _department_stats_plan(lf),
+        "subject_difficulty": _subject_difficulty_plan(lf),
+        "assessment_yearly": _assessment_yearly_plan(lf),
+        "assessment_department": _assessment_department_plan(lf),
+    }
+    keys = [k for k, plan in plans.items() if plan is not None]
+    results = pl.collect_all([plans[k] for k in keys], streaming=streaming)
+    out = dict.fromkeys(plans, pl.DataFrame([]))
+    out.update(zip(keys, results))
+    return out
\ No newline at end of file
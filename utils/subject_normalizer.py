@@ -6,10 +6,21 @@ Subject name normalization utility.
 Handles variations in subject names across the dataset.
 """
 
+import functools
+
 import polars as pl
 import re
 from difflib import SequenceMatcher
 
+# rapidfuzz scores whole buckets at once in C++; without it the similarity
+# pass falls back to the (much slower) stdlib SequenceMatcher loop
+try:
+    from rapidfuzz import fuzz as _fuzz
+    from rapidfuzz.process import cdist as _fuzz_cdist
+except ImportError:
+    _fuzz = None
+    _fuzz_cdist = None
+
 
 class SubjectNormalizer:
     """Normalize subject names by handling common variations."""
@@ -105,49 +116,98 @@ class SubjectNormalizer:
             'HR MANAGEMENT': 'HUMAN RESOURCE MANAGEMENT',
             'HRM': 'HUMAN RESOURCE MANAGEMENT',
         }
-    
+
+        # Patterns compiled once here; normalize_single may run per string
+        # in ad-hoc scripts, so it should not re-parse regexes on each call.
+        # The abbreviation alternation folds the word-split/lookup/join
+        # into a single substitution pass.
+        self._ws_re = re.compile(r'\s+')
+        self._edge_re = re.compile(r'^[\.\-\s]+|[\.\-\s]+$')
+        self._punct_after_re = re.compile(r'([\.\-/])\s+')
+        self._punct_before_re = re.compile(r'\s+([\.\-/])')
+        self._abbrev_re = re.compile(
+            r'\b(' + '|'.join(map(re.escape, self.abbreviations)) + r')\b'
+        )
+
+        # A dataset holds at most a few thousand distinct subject strings,
+        # so per-string callers hit the regex pipeline once per distinct
+        # value. Bound per instance so the cache is freed with it.
+        self.normalize_single = functools.lru_cache(maxsize=8192)(self.normalize_single)
+
     def normalize_single(self, subject_name):
         """Normalize a single subject name."""
-        if not subject_name or pd.isna(subject_name):
+        # None, empty string, or NaN (NaN != NaN) pass through unchanged
+        if not subject_name or subject_name != subject_name:
             return subject_name
-        
+
         # Convert to string and uppercase
         normalized = str(subject_name).upper().strip()
-        
+
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
+        normalized = self._ws_re.sub(' ', normalized)
+
         # Remove leading/trailing special characters
-        normalized = re.sub(r'^[\.\-\s]+|[\.\-\s]+$', '', normalized)
-        
+        normalized = self._edge_re.sub('', normalized)
+
         # Handle special characters with spaces
-        normalized = re.sub(r'([\.\-/])\s+', r'\1', normalized)
-        normalized = re.sub(r'\s+([\.\-/])', r'\1', normalized)
-        
+        normalized = self._punct_after_re.sub(r'\1', normalized)
+        normalized = self._punct_before_re.sub(r'\1', normalized)
+
         # Check direct mappings first
         if normalized in self.subject_mappings:
             return self.subject_mappings[normalized]
-        
-        # Replace common abbreviations
-        words = normalized.split()
-        replaced_words = [self.abbreviations.get(w, w) for w in words]
-        normalized = ' '.join(replaced_words)
-        
+
+        # Replace common abbreviations in one alternation pass
+        normalized = self._abbrev_re.sub(
+            lambda m: self.abbreviations[m.group(0)], normalized
+        )
+
         # Check mappings again after abbreviation replacement
         if normalized in self.subject_mappings:
             return self.subject_mappings[normalized]
-        
+
         return normalized
     
+    def _normalize_expr(self, subject_column: str) -> pl.Expr:
+        """Vectorized equivalent of `normalize_single` as a Polars expression.
+
+        The whole chain (case fold, whitespace/punctuation cleanup,
+        abbreviation expansion, dictionary mapping) runs in Rust instead of
+        one Python call per row.
+        """
+        cleaned = (
+            pl.col(subject_column)
+            .cast(pl.Utf8, strict=False)
+            .str.to_uppercase()
+            .str.strip_chars()
+            .str.replace_all(r'\s+', ' ')
+            .str.replace_all(r'^[\.\-\s]+|[\.\-\s]+$', '')
+            .str.replace_all(r'([\.\-/])\s+', '$1')
+            .str.replace_all(r'\s+([\.\-/])', '$1')
+        )
+
+        # Expand abbreviations word-by-word (word boundaries keep e.g. HR
+        # from firing inside HRM)
+        expanded = cleaned
+        for abbrev, full in self.abbreviations.items():
+            expanded = expanded.str.replace_all(rf'\b{abbrev}\b', full)
+
+        # Direct mappings win before abbreviation expansion, mirroring the
+        # two-stage lookup in normalize_single
+        return (
+            pl.when(cleaned.is_in(list(self.subject_mappings.keys())))
+            .then(cleaned.replace(self.subject_mappings))
+            .otherwise(expanded.replace(self.subject_mappings))
+        )
+
     def normalize_dataframe(self, df, subject_column='subject'):
         """Normalize subject names in a Polars DataFrame."""
         # Apply normalization
         df = df.with_columns(
-            pl.col(subject_column)
-            .map_elements(self.normalize_single, return_dtype=pl.Utf8)
+            self._normalize_expr(subject_column)
             .alias(subject_column + '_normalized')
         )
-        
+
         return df
     
     def find_similar_subjects(self, df, subject_column='subject_normalized', threshold=0.85):
@@ -155,34 +215,50 @@ class SubjectNormalizer:
         Find similar subject names that might be duplicates.
         Returns a dictionary mapping similar subjects to a canonical name.
         """
-        subjects = df[subject_column].unique().to_list()
+        subjects = [s for s in df[subject_column].unique().to_list() if s]
         subject_groups = {}
-        
-        for i, subj1 in enumerate(subjects):
-            if not subj1:
-                continue
-            
-            # Skip if already grouped
-            if any(subj1 in group for group in subject_groups.values()):
+
+        # Near-duplicate names virtually always share their first letter, so
+        # block on it: the pairwise comparison then runs per bucket instead
+        # of across the full quadratic space.
+        buckets: dict[str, list[str]] = {}
+        for s in subjects:
+            buckets.setdefault(s[0], []).append(s)
+
+        grouped = set()
+        for bucket in buckets.values():
+            if len(bucket) < 2:
                 continue
-            
-            similar = [subj1]
-            
-            for subj2 in subjects[i+1:]:
-                if not subj2:
+
+            if _fuzz_cdist is not None:
+                # One SIMD-scored matrix per bucket instead of Python ratios
+                scores = _fuzz_cdist(
+                    bucket, bucket,
+                    scorer=_fuzz.ratio,
+                    score_cutoff=threshold * 100,
+                    workers=-1,
+                )
+                def is_similar(i, j):
+                    return scores[i][j] >= threshold * 100
+            else:
+                def is_similar(i, j):
+                    return SequenceMatcher(None, bucket[i], bucket[j]).ratio() >= threshold
+
+            for i, subj1 in enumerate(bucket):
+                # Skip if already grouped
+                if subj1 in grouped:
                     continue
-                
-                # Calculate similarity
-                ratio = SequenceMatcher(None, subj1, subj2).ratio()
-                
-                if ratio >= threshold:
-                    similar.append(subj2)
-            
-            if len(similar) > 1:
-                # Use the shortest name as canonical
-                canonical = min(similar, key=len)
-                subject_groups[canonical] = similar
-        
+
+                similar = [subj1] + [
+                    bucket[j] for j in range(i + 1, len(bucket)) if is_similar(i, j)
+                ]
+
+                if len(similar) > 1:
+                    # Use the shortest name as canonical
+                    canonical = min(similar, key=len)
+                    subject_groups[canonical] = similar
+                    grouped.update(similar)
+
         return subject_groups
     
     def apply_similarity_mapping(self, df, subject_column='subject_normalized'):
@@ -196,11 +272,12 @@ class SubjectNormalizer:
             for similar in similar_list:
                 mapping[similar] = canonical
         
-        # Apply mapping
+        # Apply mapping with the native dict-lookup operator (unmatched
+        # values pass through unchanged, same as mapping.get(x, x))
         if mapping:
             df = df.with_columns(
                 pl.col(subject_column)
-                .map_elements(lambda x: mapping.get(x, x), return_dtype=pl.Utf8)
+                .replace(mapping)
                 .alias(subject_column + '_final')
             )
         else:
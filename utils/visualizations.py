@@ -8,12 +8,30 @@ Creates all dashboard visualizations.
 """
 
 import plotly.graph_objects as go
+import plotly.io as pio
 import polars as pl
-from scipy import stats
 import numpy as np
 from config import COLORS, TOP_DEPARTMENTS_DISPLAY
+from utils.calculations import _dist_expr, _memoize_by_frame, _with_pass_flags
 
+# orjson encodes figure payloads several times faster than the stdlib
+# json encoder; keep the default engine when it is not installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
 
+
+# Layout keys shared by every chart, built once at import. Each chart
+# passes _BASE_LAYOUT positionally to update_layout and overrides with
+# keywords (kwargs win over the positional dict in plotly's merge), so
+# the common literals are not re-allocated and re-validated per call.
+_BASE_LAYOUT = dict(template="plotly_white", height=400)
+_H_LEGEND = dict(orientation="h", y=-0.2, x=0.5, xanchor="center")
+
+
+@_memoize_by_frame
 def create_yoy_trends_chart(yearly_data):
     """
     Create year-over-year trends chart with pass, distinction, and fail rates.
@@ -24,75 +42,87 @@ def create_yoy_trends_chart(yearly_data):
     Returns:
         go.Figure: Plotly figure object
     """
-    fig = go.Figure()
-    
-    # Pass rate line
-    years = [int(y) if y is not None else None for y in yearly_data['exam_year'].to_list()]
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=yearly_data['pass_rate'].to_list(),
-        mode='lines+markers',
-        name='Pass Rate',
-        line=dict(color=COLORS['pass'], width=3),
-        marker=dict(size=10),
-        hovertemplate='<b>Year %{x}</b><br>Pass Rate: %{y:.1f}%<extra></extra>'
-    ))
-    
-    # Distinction rate line
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=yearly_data['dist_rate'].to_list(),
-        mode='lines+markers',
-        name='Distinction Rate',
-        line=dict(color=COLORS['distinction'], width=3),
-        marker=dict(size=10),
-        hovertemplate='<b>Year %{x}</b><br>Distinction: %{y:.1f}%<extra></extra>'
-    ))
-    
-    # Fail rate line
-    fig.add_trace(go.Scatter(
-        x=years,
-        y=yearly_data['fail_rate'].to_list(),
-        mode='lines+markers',
-        name='Failure Rate',
-        line=dict(color=COLORS['fail'], width=3),
-        marker=dict(size=10),
-        hovertemplate='<b>Year %{x}</b><br>Failure: %{y:.1f}%<extra></extra>'
-    ))
-    
-    # Add trend lines if enough data points
+    # Traces are assembled as plain dicts and handed to go.Figure once:
+    # per-add_trace validation and relayout bookkeeping run a single time
+    # for the whole figure instead of per trace
+    years = yearly_data['exam_year'].cast(pl.Int32, strict=False).to_numpy()
+    traces = [
+        dict(
+            type='scatter',
+            x=years,
+            y=yearly_data['pass_rate'].to_numpy(),
+            mode='lines+markers',
+            name='Pass Rate',
+            line=dict(color=COLORS['pass'], width=3),
+            marker=dict(size=10),
+            hovertemplate='<b>Year %{x}</b><br>Pass Rate: %{y:.1f}%<extra></extra>'
+        ),
+        dict(
+            type='scatter',
+            x=years,
+            y=yearly_data['dist_rate'].to_numpy(),
+            mode='lines+markers',
+            name='Distinction Rate',
+            line=dict(color=COLORS['distinction'], width=3),
+            marker=dict(size=10),
+            hovertemplate='<b>Year %{x}</b><br>Distinction: %{y:.1f}%<extra></extra>'
+        ),
+        dict(
+            type='scatter',
+            x=years,
+            y=yearly_data['fail_rate'].to_numpy(),
+            mode='lines+markers',
+            name='Failure Rate',
+            line=dict(color=COLORS['fail'], width=3),
+            marker=dict(size=10),
+            hovertemplate='<b>Year %{x}</b><br>Failure: %{y:.1f}%<extra></extra>'
+        ),
+    ]
+
+    # Add trend lines if enough data points. The least-squares fit has a
+    # closed form (slope = cov(x, y) / var(x)), so all three metrics are
+    # fitted in one vectorized pass instead of three linregress calls.
+    # Null rows are masked per metric, matching the old per-metric
+    # drop_nulls behavior.
     if len(yearly_data) > 2:
-        for metric, color in [('pass_rate', COLORS['pass']), 
-                              ('dist_rate', COLORS['distinction']), 
-                              ('fail_rate', COLORS['fail'])]:
-            trend_df = yearly_data.select([
-                pl.col('exam_year').cast(pl.Float64, strict=False).alias('exam_year'),
-                pl.col(metric).cast(pl.Float64, strict=False).alias(metric)
-            ]).drop_nulls()
-
-            if trend_df.height > 1:
-                x_vals = trend_df['exam_year'].to_numpy()
-                y_vals = trend_df[metric].to_numpy()
-                slope, intercept, *_ = stats.linregress(x_vals, y_vals)
-                trend_line = slope * x_vals + intercept
-
-                fig.add_trace(go.Scatter(
-                    x=x_vals.tolist(),
-                    y=trend_line.tolist(),
+        metrics = [('pass_rate', COLORS['pass']),
+                   ('dist_rate', COLORS['distinction']),
+                   ('fail_rate', COLORS['fail'])]
+        x = yearly_data['exam_year'].cast(pl.Float64, strict=False).to_numpy()
+        Y = yearly_data.select([
+            pl.col(m).cast(pl.Float64, strict=False) for m, _ in metrics
+        ]).to_numpy()
+
+        valid = ~np.isnan(Y) & ~np.isnan(x)[:, None]
+        n = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_mean = np.where(valid, x[:, None], 0.0).sum(axis=0) / n
+            y_mean = np.where(valid, Y, 0.0).sum(axis=0) / n
+            dx = x[:, None] - x_mean
+            var_x = np.where(valid, dx * dx, 0.0).sum(axis=0)
+            slopes = np.where(valid, dx * (Y - y_mean), 0.0).sum(axis=0) / var_x
+        intercepts = y_mean - slopes * x_mean
+
+        for col_idx, (metric, color) in enumerate(metrics):
+            if n[col_idx] > 1 and var_x[col_idx] > 0:
+                x_vals = x[valid[:, col_idx]]
+                traces.append(dict(
+                    type='scatter',
+                    x=x_vals,
+                    y=slopes[col_idx] * x_vals + intercepts[col_idx],
                     mode='lines',
                     line=dict(color=color, width=2, dash='dash'),
                     showlegend=False,
                     opacity=0.4,
                     hoverinfo='skip'
                 ))
-    
-    fig.update_layout(
+
+    fig = go.Figure(data=traces)
+    fig.update_layout(_BASE_LAYOUT,
         xaxis_title="Academic Year",
         yaxis_title="Percentage (%)",
         hovermode='x unified',
-        height=400,
-        template="plotly_white",
-        legend=dict(orientation='h', y=-0.2, x=0.5, xanchor='center'),
+        legend=_H_LEGEND,
         yaxis=dict(range=[0, 100]),
         xaxis=dict(type='linear', tickformat='d', dtick=1)
     )
@@ -100,128 +130,105 @@ def create_yoy_trends_chart(yearly_data):
     return fig
 
 
+def _comparison_traces(lf, key_col, top_n):
+    """Build pass-rate line traces for the top-N groups of `key_col`.
+
+    Shared by both views of the comparison chart — the department and
+    subject branches only ever differed in grouping column and top-N.
+    Returns (traces, y_min, y_max) with the y-range padded 5% around
+    the plotted rates.
+    """
+    # Lazy so only the key column is scanned for the top-N pre-query
+    top_names = (lf.group_by(key_col)
+                 .agg(pl.count().alias('count'))
+                 .sort('count', descending=True)
+                 .head(top_n)
+                 .collect()[key_col].to_list())
+
+    # One lazy plan, one collect; loader frames already carry is_pass,
+    # so the normalization is a no-op there. A single-year group cannot
+    # draw a line, so it is dropped in the plan rather than len-checked
+    # per partition in the loop.
+    data = (_with_pass_flags(lf)
+        .filter(pl.col(key_col).is_in(top_names))
+        .group_by(['exam_year', key_col])
+        .agg([
+            pl.count().alias('total'),
+            pl.col('is_pass').sum().alias('pass_count')
+        ])
+        .with_columns(
+            (pl.col('pass_count') / pl.col('total') * 100).alias('pass_rate')
+        )
+        # Single-key sort: partition_by below keeps row order within each
+        # group, so the groups come out year-sorted without paying for a
+        # second sort key
+        .filter(pl.count().over(key_col) >= 2)
+        .sort('exam_year')
+        .collect()
+    )
+
+    # Dynamic y-axis: 5% padding around the plotted rates. Series min/max
+    # reduce in vectorized code instead of a Python loop over a list;
+    # both come back None on an empty aggregate.
+    min_rate = data['pass_rate'].min()
+    max_rate = data['pass_rate'].max()
+    y_min = max(0, (min_rate if min_rate is not None else 0) - 5)
+    y_max = min(100, (max_rate if max_rate is not None else 100) + 5)
+
+    # One split instead of re-filtering the aggregate per group
+    subsets = data.partition_by(key_col, as_dict=True)
+
+    traces = []
+    for name in top_names:
+        subset = subsets.get(name)
+        if subset is None:
+            continue
+
+        traces.append(dict(
+            type='scatter',
+            x=subset['exam_year'].to_numpy(),
+            y=subset['pass_rate'].to_numpy(),
+            mode='lines+markers',
+            name=str(name)[:30],
+            line=dict(width=2),
+            marker=dict(size=8),
+            connectgaps=False,
+            hovertemplate=f'<b>{name}</b><br>Year: %{{x}}<br>Pass Rate: %{{y:.1f}}%<extra></extra>'
+        ))
+
+    return traces, y_min, y_max
+
+
+@_memoize_by_frame
 def create_department_comparison_chart(df, department_filter='All'):
     """
     Create department or subject comparison chart with improved handling.
-    
+
     Args:
         df (pl.DataFrame): Input DataFrame
         department_filter (str): Selected department
-        
+
     Returns:
         go.Figure: Plotly figure object
     """
-    import polars as pl
-    
-    fig = go.Figure()
-    
+
     if department_filter == 'All':
-        # Show top departments
-        top_depts = (df.group_by('department')
-                     .agg(pl.count().alias('count'))
-                     .sort('count', descending=True)
-                     .head(TOP_DEPARTMENTS_DISPLAY)['department'].to_list())
-        
-        # Normalize pass_fail for accurate pass count
-        pass_fail_norm = df['pass_fail'].cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase()
-        
-        dept_data = (df.with_columns(pass_fail_norm.alias('_pass_fail_norm'))
-            .filter(pl.col('department').is_in(top_depts))
-            .group_by(['exam_year', 'department'])
-            .agg([
-                pl.count().alias('total'),
-                (pl.col('_pass_fail_norm') == 'pass').sum().alias('pass_count')
-            ])
-            .with_columns(
-                (pl.col('pass_count') / pl.col('total') * 100).alias('pass_rate')
-            )
-            .sort(['department', 'exam_year'])
+        # Top departments across the whole frame
+        traces, y_min, y_max = _comparison_traces(
+            df.lazy(), 'department', TOP_DEPARTMENTS_DISPLAY
         )
-        
-        # Calculate min and max pass rates for dynamic y-axis
-        all_rates = dept_data['pass_rate'].to_list()
-        min_rate = min(all_rates) if all_rates else 0
-        max_rate = max(all_rates) if all_rates else 100
-        
-        # Add 5% padding to min/max
-        y_min = max(0, min_rate - 5)
-        y_max = min(100, max_rate + 5)
-        
-        for dept_name in top_depts:
-            dept_subset = dept_data.filter(pl.col('department') == dept_name)
-            
-            # Skip departments with insufficient data
-            if len(dept_subset) < 2:
-                continue
-                
-            fig.add_trace(go.Scatter(
-                x=dept_subset['exam_year'].to_list(),
-                y=dept_subset['pass_rate'].to_list(),
-                mode='lines+markers',
-                name=dept_name[:30],
-                line=dict(width=2),
-                marker=dict(size=8),
-                connectgaps=False,
-                hovertemplate=f'<b>{dept_name}</b><br>Year: %{{x}}<br>Pass Rate: %{{y:.1f}}%<extra></extra>'
-            ))
     else:
-        # Show subjects within selected department
-        dept_df = df.filter(pl.col('department') == department_filter)
-
-        top_subjects = (dept_df.group_by('subject')
-                        .agg(pl.count().alias('count'))
-                        .sort('count', descending=True)
-                        .head(10)['subject'].to_list())
-        
-        # Normalize pass_fail for accurate pass count
-        pass_fail_norm = dept_df['pass_fail'].cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase()
-        
-        subj_data = (dept_df.with_columns(pass_fail_norm.alias('_pass_fail_norm'))
-            .filter(pl.col('subject').is_in(top_subjects))
-            .group_by(['exam_year', 'subject'])
-            .agg([
-                pl.count().alias('total'),
-                (pl.col('_pass_fail_norm') == 'pass').sum().alias('pass_count')
-            ])
-            .with_columns(
-                (pl.col('pass_count') / pl.col('total') * 100).alias('pass_rate')
-            )
-            .sort(['subject', 'exam_year'])
+        # Top subjects within the selected department
+        traces, y_min, y_max = _comparison_traces(
+            df.lazy().filter(pl.col('department') == department_filter),
+            'subject', 10
         )
-        
-        # Calculate min and max pass rates for dynamic y-axis
-        all_rates = subj_data['pass_rate'].to_list()
-        min_rate = min(all_rates) if all_rates else 0
-        max_rate = max(all_rates) if all_rates else 100
-        
-        # Add 5% padding to min/max
-        y_min = max(0, min_rate - 5)
-        y_max = min(100, max_rate + 5)
-        
-        for subj_name in top_subjects:
-            subj_subset = subj_data.filter(pl.col('subject') == subj_name)
-            
-            # Skip subjects with insufficient data
-            if len(subj_subset) < 2:
-                continue
-                
-            fig.add_trace(go.Scatter(
-                x=subj_subset['exam_year'].to_list(),
-                y=subj_subset['pass_rate'].to_list(),
-                mode='lines+markers',
-                name=str(subj_name)[:30],
-                line=dict(width=2),
-                marker=dict(size=8),
-                connectgaps=False,
-                hovertemplate=f'<b>{subj_name}</b><br>Year: %{{x}}<br>Pass Rate: %{{y:.1f}}%<extra></extra>'
-            ))
-    
-    fig.update_layout(
+
+    fig = go.Figure(data=traces)
+    fig.update_layout(_BASE_LAYOUT,
         xaxis_title="Academic Year",
         yaxis_title="Pass Rate (%)",
         hovermode='x unified',
-        height=400,
-        template="plotly_white",
         legend=dict(orientation='v', y=1, x=1.02),
         yaxis=dict(range=[y_min, y_max]),  # Dynamic range based on data
         xaxis=dict(type='linear', dtick=1)  # Force linear x-axis with year steps
@@ -230,6 +237,7 @@ def create_department_comparison_chart(df, department_filter='All'):
     return fig
 
 
+@_memoize_by_frame
 def create_assessment_trend_chart(summary_df):
     """
     Create CIA vs ESE trend chart by academic year.
@@ -243,13 +251,11 @@ def create_assessment_trend_chart(summary_df):
     fig = go.Figure()
 
     if summary_df.height == 0 or "exam_year" not in summary_df.columns:
-        fig.update_layout(
+        fig.update_layout(_BASE_LAYOUT,
             xaxis_title="Academic Year",
             yaxis_title="Average Percentage",
             hovermode="x unified",
-            height=400,
-            template="plotly_white",
-            legend=dict(orientation="h", y=-0.2, x=0.5, xanchor="center"),
+            legend=_H_LEGEND,
             annotations=[
                 dict(
                     text="No assessment data available for the selected filters.",
@@ -264,68 +270,41 @@ def create_assessment_trend_chart(summary_df):
         )
         return fig
 
-    # CIA and ESE trends for theory
-    years = [int(y) if y is not None else None for y in summary_df["exam_year"].to_list()]
-    fig.add_trace(
-        go.Scatter(
-            x=years,
-            y=summary_df["cia_theory_avg"].to_list(),
-            mode="lines+markers",
-            name="CIA Theory",
-            line=dict(color="#2563eb", width=3),
-            marker=dict(size=8),
-            hovertemplate="<b>Year %{x}</b><br>CIA Theory: %{y:.1f}<extra></extra>",
-        )
-    )
-    fig.add_trace(
-        go.Scatter(
+    # CIA and ESE trends for theory and practical; dict traces validated
+    # once at figure construction
+    years = summary_df["exam_year"].cast(pl.Int32, strict=False).to_numpy()
+    series = [
+        ("cia_theory_avg", "CIA Theory", dict(color="#2563eb", width=3)),
+        ("ese_theory_avg", "ESE Theory", dict(color="#0ea5e9", width=3)),
+        ("cia_practical_avg", "CIA Practical", dict(color="#f97316", width=3, dash="dash")),
+        ("ese_practical_avg", "ESE Practical", dict(color="#facc15", width=3, dash="dash")),
+    ]
+    fig = go.Figure(data=[
+        dict(
+            type="scatter",
             x=years,
-            y=summary_df["ese_theory_avg"].to_list(),
+            y=summary_df[col].to_numpy(),
             mode="lines+markers",
-            name="ESE Theory",
-            line=dict(color="#0ea5e9", width=3),
+            name=name,
+            line=line,
             marker=dict(size=8),
-            hovertemplate="<b>Year %{x}</b><br>ESE Theory: %{y:.1f}<extra></extra>",
+            hovertemplate="<b>Year %{x}</b><br>" + name + ": %{y:.1f}<extra></extra>",
         )
-    )
+        for col, name, line in series
+    ])
 
-    # CIA and ESE trends for practical
-    fig.add_trace(
-        go.Scatter(
-            x=years,
-            y=summary_df["cia_practical_avg"].to_list(),
-            mode="lines+markers",
-            name="CIA Practical",
-            line=dict(color="#f97316", width=3, dash="dash"),
-            marker=dict(size=8),
-            hovertemplate="<b>Year %{x}</b><br>CIA Practical: %{y:.1f}<extra></extra>",
-        )
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=years,
-            y=summary_df["ese_practical_avg"].to_list(),
-            mode="lines+markers",
-            name="ESE Practical",
-            line=dict(color="#facc15", width=3, dash="dash"),
-            marker=dict(size=8),
-            hovertemplate="<b>Year %{x}</b><br>ESE Practical: %{y:.1f}<extra></extra>",
-        )
-    )
-
-    fig.update_layout(
+    fig.update_layout(_BASE_LAYOUT,
         xaxis_title="Academic Year",
         yaxis_title="Average Percentage",
         hovermode="x unified",
-        height=400,
-        template="plotly_white",
-        legend=dict(orientation="h", y=-0.2, x=0.5, xanchor="center"),
+        legend=_H_LEGEND,
         xaxis=dict(type='linear', dtick=1)
     )
 
     return fig
 
 
+@_memoize_by_frame
 def create_assessment_gap_chart(dept_summary):
     """
     Create grouped bar chart showing CIA vs ESE gaps by department.
@@ -339,12 +318,10 @@ def create_assessment_gap_chart(dept_summary):
     fig = go.Figure()
 
     if dept_summary.height == 0 or "department" not in dept_summary.columns:
-        fig.update_layout(
+        fig.update_layout(_BASE_LAYOUT,
             xaxis_title="Department",
             yaxis_title="Average Gap (pts)",
             barmode="group",
-            template="plotly_white",
-            height=400,
             annotations=[
                 dict(
                     text="No department-level assessment data available.",
@@ -361,39 +338,37 @@ def create_assessment_gap_chart(dept_summary):
 
     departments = dept_summary["department"].to_list()
 
-    fig.add_trace(
-        go.Bar(
+    fig = go.Figure(data=[
+        dict(
+            type="bar",
             x=departments,
-            y=dept_summary["theory_gap"].to_list(),
+            y=dept_summary["theory_gap"].to_numpy(),
             name="Theory Gap (ESE - CIA)",
-            marker_color="#3b82f6",
+            marker=dict(color="#3b82f6"),
             hovertemplate="<b>%{x}</b><br>Theory Gap: %{y:.1f}<extra></extra>",
-        )
-    )
-
-    fig.add_trace(
-        go.Bar(
+        ),
+        dict(
+            type="bar",
             x=departments,
-            y=dept_summary["practical_gap"].to_list(),
+            y=dept_summary["practical_gap"].to_numpy(),
             name="Practical Gap (ESE - CIA)",
-            marker_color="#f59e0b",
+            marker=dict(color="#f59e0b"),
             hovertemplate="<b>%{x}</b><br>Practical Gap: %{y:.1f}<extra></extra>",
-        )
-    )
+        ),
+    ])
 
-    fig.update_layout(
+    fig.update_layout(_BASE_LAYOUT,
         xaxis_title="Department",
         yaxis_title="Average Gap (pts)",
         barmode="group",
-        template="plotly_white",
-        height=400,
-        legend=dict(orientation="h", y=-0.2, x=0.5, xanchor="center"),
+        legend=_H_LEGEND,
         yaxis=dict(zeroline=True, zerolinewidth=1.5, zerolinecolor="#94a3b8"),
     )
 
     return fig
 
 
+@_memoize_by_frame
 def create_distribution_chart(df):
     """
     Create stacked bar chart showing performance distribution by year.
@@ -405,63 +380,70 @@ def create_distribution_chart(df):
     Returns:
         go.Figure: Plotly figure object
     """
-    import polars as pl
     
-    # Create a classification column combining pass_fail and distinction
-    df_chart = df.with_columns(
-        pl.when(
-            pl.col('pass_fail').cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase() == 'fail'
-        )
-        .then(pl.lit('Fail'))
-        .when(
-            (pl.col('pass_fail').cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase() == 'pass') & 
-            (pl.col('performance') == 'Distinction')
-        )
-        .then(pl.lit('Distinction'))
-        .when(
-            pl.col('pass_fail').cast(pl.Utf8, strict=False).fill_null("").str.to_lowercase() == 'pass'
+    # Classification and aggregation run as one lazy plan so the
+    # classification column is never materialized at full frame height.
+    # Loader frames already carry is_pass/is_fail/is_dist, so the ladder
+    # branches on precomputed bitmaps instead of re-lowering pass_fail.
+    # `pivot` is eager-only, so the plan collects first; by then the frame
+    # is already reduced to one row per (year, category).
+    # A closed Enum is safe for this internal-only key (unlike the
+    # user-filterable performance column): the group-by then hashes u32
+    # category codes instead of UTF-8 strings
+    category_dtype = pl.Enum(['Distinction', 'Pass', 'Fail', 'Other'])
+    lf = _with_pass_flags(df.lazy())
+    dist_counts = (lf
+        .with_columns(
+            pl.when(pl.col('is_fail'))
+            .then(pl.lit('Fail'))
+            .when(pl.col('is_pass') & _dist_expr(lf))
+            .then(pl.lit('Distinction'))
+            .when(pl.col('is_pass'))
+            .then(pl.lit('Pass'))
+            .otherwise(pl.lit('Other'))
+            .cast(category_dtype)
+            .alias('_category')
         )
-        .then(pl.lit('Pass'))
-        .otherwise(pl.lit('Other'))
-        .alias('_category')
-    )
-    
-    dist_data = (df_chart
         .group_by(['exam_year', '_category'])
         .agg(pl.count().alias('count'))
+        .collect()
+    )
+
+    dist_data = (dist_counts
         .pivot(index='exam_year', columns='_category', values='count')
         .fill_null(0)
         .sort('exam_year')
     )
     
-    fig = go.Figure()
-    
-    # Add bars for each performance category in correct order
+    # Add bars for each performance category in correct order; years are
+    # cast to integers once for proper x-axis display
+    years = dist_data['exam_year'].cast(pl.Int32, strict=False).to_numpy()
+    traces = []
     for perf in ['Distinction', 'Pass', 'Fail']:
         if perf in dist_data.columns:
-            # Convert years to integers for proper x-axis display
-            years = [int(y) if y is not None else None for y in dist_data['exam_year'].to_list()]
-            fig.add_trace(go.Bar(
+            traces.append(dict(
+                type='bar',
                 x=years,
-                y=dist_data[perf].to_list(),
+                y=dist_data[perf].to_numpy(),
                 name=perf,
-                marker_color=COLORS.get(perf.lower(), COLORS['neutral']),
+                marker=dict(color=COLORS.get(perf.lower(), COLORS['neutral'])),
                 hovertemplate=f'<b>{perf}</b><br>Year: %{{x}}<br>Count: %{{y:,}}<extra></extra>'
             ))
-    
-    fig.update_layout(
+
+    fig = go.Figure(data=traces)
+    fig.update_layout(_BASE_LAYOUT,
         barmode='stack',
         xaxis_title="Academic Year",
         yaxis_title="Number of Exam Attempts",
         height=350,
-        template="plotly_white",
-        legend=dict(orientation='h', y=-0.2, x=0.5, xanchor='center'),
+        legend=_H_LEGEND,
         xaxis=dict(type='linear', tickformat='d')
     )
     
     return fig
 
 
+@_memoize_by_frame
 def create_subject_difficulty_chart(difficulty_df: pl.DataFrame) -> go.Figure:
     """
     Create bar chart showing subject difficulty.
@@ -471,11 +453,9 @@ def create_subject_difficulty_chart(difficulty_df: pl.DataFrame) -> go.Figure:
     fig = go.Figure()
 
     if difficulty_df is None or difficulty_df.height == 0:
-        fig.update_layout(
+        fig.update_layout(_BASE_LAYOUT,
             xaxis_title="Subject",
             yaxis_title="Average Marks",
-            template="plotly_white",
-            height=400,
             annotations=[
                 dict(
                     text="No subject difficulty data available for the selected filters.",
@@ -494,33 +474,40 @@ def create_subject_difficulty_chart(difficulty_df: pl.DataFrame) -> go.Figure:
     data = difficulty_df.sort("avg_total_marks")
 
     subjects = data["subject"].to_list()
-    avg_marks = data["avg_total_marks"].to_list()
-    pass_rates = data["pass_rate"].to_list() if "pass_rate" in data.columns else [None] * len(subjects)
+    avg_marks = data["avg_total_marks"].cast(pl.Float64, strict=False).to_numpy()
+    if "pass_rate" in data.columns:
+        pass_rates = data["pass_rate"].cast(pl.Float64, strict=False).to_numpy()
+    else:
+        pass_rates = np.full(len(subjects), np.nan)
+
+    # Both hover fields ride in one 2-D customdata array; the stack happens
+    # in NumPy rather than a Python-level list transpose, and nulls
+    # serialize as NaN→null through the typed-array path
+    customdata = np.stack([pass_rates, avg_marks], axis=1)
 
-    fig.add_trace(
-        go.Bar(
+    fig = go.Figure(data=[
+        dict(
+            type="bar",
             x=subjects,
             y=avg_marks,
-            marker_color="#3b82f6",
-            hovertemplate="<b>%{x}</b><br>Avg Marks: %{y:.1f}"
-            + "<br>Pass Rate: %{customdata:.1f}%<extra></extra>",
-            customdata=pass_rates,
+            marker=dict(color="#3b82f6"),
+            hovertemplate="<b>%{x}</b><br>Avg Marks: %{customdata[1]:.1f}"
+            + "<br>Pass Rate: %{customdata[0]:.1f}%<extra></extra>",
+            customdata=customdata,
         )
-    )
+    ])
 
     # Calculate dynamic y-axis range based on data
-    min_val = min(avg_marks) if avg_marks else 0
-    max_val = max(avg_marks) if avg_marks else 100
+    min_val = avg_marks.min() if avg_marks.size else 0
+    max_val = avg_marks.max() if avg_marks.size else 100
     
     # Add 10% padding to both sides for visibility
     y_min = max(0, min_val - (max_val - min_val) * 0.1)
     y_max = max_val + (max_val - min_val) * 0.1
 
-    fig.update_layout(
+    fig.update_layout(_BASE_LAYOUT,
         xaxis_title="Subject (hardest to easiest)",
         yaxis_title="Average Marks",
-        template="plotly_white",
-        height=400,
         xaxis=dict(tickangle=-45),
         yaxis=dict(range=[y_min, y_max])
     )
@@ -538,11 +525,9 @@ def create_top_bottom_departments_chart(leaderboard: dict) -> go.Figure:
     fig = go.Figure()
 
     if not leaderboard or "combined" not in leaderboard:
-        fig.update_layout(
+        fig.update_layout(_BASE_LAYOUT,
             xaxis_title="Pass Rate (%)",
             yaxis_title="Department",
-            template="plotly_white",
-            height=400,
             annotations=[
                 dict(
                     text="No department leaderboard data available.",
@@ -562,34 +547,31 @@ def create_top_bottom_departments_chart(leaderboard: dict) -> go.Figure:
         df_plot = combined.sort("pass_rate")
 
         departments = df_plot["department"].to_list()
-        pass_rates = df_plot["pass_rate"].to_list()
+        pass_rates = df_plot["pass_rate"].to_numpy()
         categories = df_plot["category"].to_list() if "category" in df_plot.columns else ["Dept"] * len(departments)
 
         colors = ["#22c55e" if cat == "Top" else "#ef4444" for cat in categories]
 
-        fig.add_trace(
-            go.Bar(
+        fig = go.Figure(data=[
+            dict(
+                type="bar",
                 x=pass_rates,
                 y=departments,
                 orientation="h",
-                marker_color=colors,
+                marker=dict(color=colors),
                 hovertemplate="<b>%{y}</b><br>Pass Rate: %{x:.1f}%<extra></extra>",
             )
-        )
+        ])
 
-        fig.update_layout(
+        fig.update_layout(_BASE_LAYOUT,
             xaxis_title="Pass Rate (%)",
             yaxis_title="Department",
-            template="plotly_white",
-            height=400,
             yaxis=dict(autorange="reversed"),
         )
     else:
-        fig.update_layout(
+        fig.update_layout(_BASE_LAYOUT,
             xaxis_title="Pass Rate (%)",
             yaxis_title="Department",
-            template="plotly_white",
-            height=400,
             annotations=[
                 dict(
                     text="No department leaderboard data available.",